@@ -1,12 +1,17 @@
+import math
 import numpy as np
 import pygame
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from enum import Enum
 from abc import ABC, abstractmethod
-import asyncio
 import heapq
-from collections import defaultdict
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 # Physics constants
 GRAVITY = 9.81  # m/s^2
@@ -14,6 +19,60 @@ AIR_RESISTANCE = 0.1
 HUMAN_MAX_SPEED = 1.4  # m/s (average walking speed)
 DRONE_MAX_SPEED = 5.0  # m/s
 DRONE_MAX_ACCELERATION = 2.0  # m/s^2
+WAYPOINT_RADIUS = 0.1  # m, distance at which a waypoint counts as reached
+WAYPOINT_RADIUS_SQ = WAYPOINT_RADIUS * WAYPOINT_RADIUS  # compared against squared distances
+SIM_DT = 0.016  # s, fixed simulation timestep (~60 Hz)
+STATE_DTYPE = np.float32  # metre-scale world, single precision is plenty
+AIR_RESISTANCE_F32 = np.float32(AIR_RESISTANCE)
+
+# Agent kinds (row tags in the simulation state arrays)
+HUMAN = 0
+DRONE = 1
+
+
+if HAVE_NUMBA:
+    @njit("void(float32[:, :], float32[:, :], float32[:, :], float32[:, :], float32[:], float32[:], "
+          "float32[:], float32[:], int8[:], boolean[:], boolean[:], float32)",
+          cache=True, fastmath=True, parallel=True)
+    def _physics_step(pos, vel, acc, target, max_speed, max_accel, fatigue, battery, kind, active, reached, dt):
+        # Fused per-agent physics tick; updates the state arrays in place
+        for i in prange(pos.shape[0]):
+            reached[i] = False
+            if not active[i]:
+                continue
+
+            dx = target[i, 0] - pos[i, 0]
+            dy = target[i, 1] - pos[i, 1]
+            dist = math.sqrt(dx * dx + dy * dy)
+
+            if kind[i] == HUMAN:
+                if dist > 0:
+                    current_max_speed = max_speed[i] * (1 - fatigue[i])
+                    vel[i, 0] = dx / dist * current_max_speed
+                    vel[i, 1] = dy / dist * current_max_speed
+                fatigue[i] = min(0.5, fatigue[i] + 0.001 * dt)
+            else:
+                if dist > 0:
+                    a_max = max_accel[i]
+                    ax = dx / dist * max_speed[i] - vel[i, 0]
+                    ay = dy / dist * max_speed[i] - vel[i, 1]
+                    acc[i, 0] = max(-a_max, min(a_max, ax))
+                    acc[i, 1] = max(-a_max, min(a_max, ay))
+                battery[i] -= 0.01 * math.sqrt(vel[i, 0] ** 2 + vel[i, 1] ** 2) * dt
+
+            vel[i, 0] += acc[i, 0] * dt
+            vel[i, 1] += acc[i, 1] * dt
+            pos[i, 0] += vel[i, 0] * dt
+            pos[i, 1] += vel[i, 1] * dt
+
+            speed = math.sqrt(vel[i, 0] ** 2 + vel[i, 1] ** 2)
+            damping = 1 - AIR_RESISTANCE_F32 * speed * dt
+            vel[i, 0] *= damping
+            vel[i, 1] *= damping
+
+            dx = target[i, 0] - pos[i, 0]
+            dy = target[i, 1] - pos[i, 1]
+            reached[i] = dx * dx + dy * dy < WAYPOINT_RADIUS_SQ
 
 
 class TerrainType(Enum):
@@ -22,7 +81,13 @@ class TerrainType(Enum):
     GRAVEL = 0.8
 
 
-@dataclass
+# Integer terrain codes stored in the terrain map, and the per-code colour table
+PAVEMENT, GRASS, GRAVEL = 0, 1, 2
+TERRAIN_CODE = {TerrainType.PAVEMENT: PAVEMENT, TerrainType.GRASS: GRASS, TerrainType.GRAVEL: GRAVEL}
+TERRAIN_COLOR = np.array([(200, 200, 200), (100, 200, 100), (150, 150, 150)], dtype=np.uint8)
+
+
+@dataclass(slots=True)
 class Vector2D:
     x: float
     y: float
@@ -34,7 +99,7 @@ class Vector2D:
         return Vector2D(self.x - other.x, self.y - other.y)
 
     def magnitude(self):
-        return np.sqrt(self.x ** 2 + self.y ** 2)
+        return math.sqrt(self.x * self.x + self.y * self.y)
 
     def normalize(self):
         mag = self.magnitude()
@@ -44,96 +109,63 @@ class Vector2D:
 
 
 class PhysicsObject:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('position', 'velocity', 'acceleration', 'mass')
+
     def __init__(self, position: Vector2D, mass: float):
         self.position = position
         self.velocity = Vector2D(0, 0)
         self.acceleration = Vector2D(0, 0)
         self.mass = mass
 
-    def update(self, dt: float):
-        # Update position and velocity using verlet integration
-        self.velocity.x += self.acceleration.x * dt
-        self.velocity.y += self.acceleration.y * dt
-        self.position.x += self.velocity.x * dt
-        self.position.y += self.velocity.y * dt
-
-        # Apply air resistance
-        speed = self.velocity.magnitude()
-        if speed > 0:
-            resistance = AIR_RESISTANCE * speed * speed
-            direction = self.velocity.normalize()
-            self.velocity.x -= direction.x * resistance * dt
-            self.velocity.y -= direction.y * resistance * dt
-
 
 class Agent(PhysicsObject, ABC):
+    # sim_index is assigned by Simulation.add_agent
+    __slots__ = ('capacity', 'current_load', 'path', 'path_idx', 'stats', 'render_color', 'max_speed',
+                 'sim_index')
+
     def __init__(self, position: Vector2D, mass: float, capacity: float):
         super().__init__(position, mass)
         self.capacity = capacity
         self.current_load = 0
         self.path = []
+        self.path_idx = 0  # index of the next waypoint in path
         self.stats = {
             'distance_traveled': 0,
             'items_collected': 0,
             'time_elapsed': 0
         }
 
-    @abstractmethod
-    def calculate_movement(self, target: Vector2D, dt: float):
-        pass
-
     @abstractmethod
     def can_pickup(self, item_weight: float) -> bool:
         pass
 
 
 class Human(Agent):
+    __slots__ = ('fatigue',)
+    kind = HUMAN
+
     def __init__(self, position: Vector2D):
         super().__init__(position, mass=70, capacity=20)
+        self.render_color = (0, 0, 255)
         self.fatigue = 0
         self.max_speed = HUMAN_MAX_SPEED
 
-    def calculate_movement(self, target: Vector2D, dt: float):
-        direction = target - self.position
-        if direction.magnitude() > 0:
-            # Apply fatigue effect
-            current_max_speed = self.max_speed * (1 - self.fatigue)
-            normalized_direction = direction.normalize()
-            self.velocity.x = normalized_direction.x * current_max_speed
-            self.velocity.y = normalized_direction.y * current_max_speed
-
-        # Increase fatigue over time
-        self.fatigue = min(0.5, self.fatigue + 0.001 * dt)
-
     def can_pickup(self, item_weight: float) -> bool:
         return self.current_load + item_weight <= self.capacity
 
 
 class Drone(Agent):
+    __slots__ = ('max_acceleration', 'battery_level')
+    kind = DRONE
+
     def __init__(self, position: Vector2D):
         super().__init__(position, mass=2, capacity=5)
+        self.render_color = (255, 165, 0)
         self.max_speed = DRONE_MAX_SPEED
         self.max_acceleration = DRONE_MAX_ACCELERATION
         self.battery_level = 100
 
-    def calculate_movement(self, target: Vector2D, dt: float):
-        direction = target - self.position
-        if direction.magnitude() > 0:
-            # Calculate desired velocity
-            normalized_direction = direction.normalize()
-            desired_velocity = Vector2D(
-                normalized_direction.x * self.max_speed,
-                normalized_direction.y * self.max_speed
-            )
-
-            # Calculate acceleration needed
-            velocity_difference = desired_velocity - self.velocity
-            self.acceleration.x = np.clip(velocity_difference.x, -self.max_acceleration, self.max_acceleration)
-            self.acceleration.y = np.clip(velocity_difference.y, -self.max_acceleration, self.max_acceleration)
-
-        # Decrease battery level based on movement
-        self.battery_level -= 0.01 * self.velocity.magnitude() * dt
-
     def can_pickup(self, item_weight: float) -> bool:
         return self.current_load + item_weight <= self.capacity and self.battery_level > 10
 
@@ -142,22 +174,27 @@ class Environment:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.terrain = defaultdict(lambda: TerrainType.PAVEMENT)
+        self.terrain = np.full((width, height), PAVEMENT, dtype=np.uint8)
         self.obstacles = []
         self.trash_items = []
         self.bins = []
+        # Set whenever the static layout (terrain, obstacles, bins) changes
+        self.static_dirty = True
 
     def add_obstacle(self, pos: Vector2D, size: Vector2D):
         self.obstacles.append((pos, size))
+        self.static_dirty = True
 
     def add_trash(self, pos: Vector2D, weight: float):
         self.trash_items.append((pos, weight))
 
     def add_bin(self, pos: Vector2D):
         self.bins.append(pos)
+        self.static_dirty = True
 
     def set_terrain(self, pos: Vector2D, terrain_type: TerrainType):
-        self.terrain[(int(pos.x), int(pos.y))] = terrain_type
+        self.terrain[int(pos.x), int(pos.y)] = TERRAIN_CODE[terrain_type]
+        self.static_dirty = True
 
 
 class Simulation:
@@ -165,31 +202,139 @@ class Simulation:
         self.environment = environment
         self.agents = []
         self.time = 0
+        self.duration = 0
         self.running = False
 
+        # Agent state as parallel arrays, one row per agent (index = agent.sim_index)
+        self.pos_xy = np.zeros((0, 2), dtype=STATE_DTYPE)
+        self.vel_xy = np.zeros((0, 2), dtype=STATE_DTYPE)
+        self.acc_xy = np.zeros((0, 2), dtype=STATE_DTYPE)
+        self.target_xy = np.zeros((0, 2), dtype=STATE_DTYPE)
+        self.max_speed = np.zeros(0, dtype=STATE_DTYPE)
+        self.max_accel = np.zeros(0, dtype=STATE_DTYPE)
+        self.fatigue = np.zeros(0, dtype=STATE_DTYPE)
+        self.battery = np.zeros(0, dtype=STATE_DTYPE)
+        self.agent_kind = np.zeros(0, dtype=np.int8)
+        self.active = np.zeros(0, dtype=bool)
+        self.reached = np.zeros(0, dtype=bool)
+
+    @staticmethod
+    def _append(array, row):
+        # Append one row while keeping the array's dtype
+        return np.concatenate([array, np.asarray([row], dtype=array.dtype)])
+
     def add_agent(self, agent: Agent):
+        agent.sim_index = len(self.agents)
         self.agents.append(agent)
 
-    async def run(self, duration: float):
+        self.pos_xy = self._append(self.pos_xy, (agent.position.x, agent.position.y))
+        self.vel_xy = self._append(self.vel_xy, (agent.velocity.x, agent.velocity.y))
+        self.acc_xy = self._append(self.acc_xy, (agent.acceleration.x, agent.acceleration.y))
+        self.target_xy = self._append(self.target_xy, (0.0, 0.0))
+        self.max_speed = self._append(self.max_speed, agent.max_speed)
+        self.max_accel = self._append(self.max_accel, getattr(agent, 'max_acceleration', 0.0))
+        self.fatigue = self._append(self.fatigue, getattr(agent, 'fatigue', 0.0))
+        self.battery = self._append(self.battery, getattr(agent, 'battery_level', 0.0))
+        self.agent_kind = self._append(self.agent_kind, agent.kind)
+        self.active = self._append(self.active, False)
+        self.reached = self._append(self.reached, False)
+
+    def _sync_targets(self):
+        # Load each agent's next waypoint into the target array
+        for agent in self.agents:
+            i = agent.sim_index
+            self.active[i] = agent.path_idx < len(agent.path)
+            if self.active[i]:
+                target = agent.path[agent.path_idx]
+                self.target_xy[i] = (target.x, target.y)
+
+    def _sync_agents(self):
+        # Write the array state back onto the agent objects
+        for agent in self.agents:
+            i = agent.sim_index
+            agent.position.x, agent.position.y = self.pos_xy[i]
+            agent.velocity.x, agent.velocity.y = self.vel_xy[i]
+            agent.acceleration.x, agent.acceleration.y = self.acc_xy[i]
+            if agent.kind == HUMAN:
+                agent.fatigue = self.fatigue[i]
+            else:
+                agent.battery_level = self.battery[i]
+
+    def _step(self, dt: float):
+        if not self.active.any():
+            return
+
+        if HAVE_NUMBA:
+            _physics_step(self.pos_xy, self.vel_xy, self.acc_xy, self.target_xy,
+                          self.max_speed, self.max_accel, self.fatigue, self.battery,
+                          self.agent_kind, self.active, self.reached, STATE_DTYPE(dt))
+        else:
+            self._step_numpy(dt)
+
+        # Advance the agents that reached their waypoint
+        for i in np.flatnonzero(self.reached):
+            agent = self.agents[i]
+            agent.path_idx += 1
+            if agent.path_idx < len(agent.path):
+                target = agent.path[agent.path_idx]
+                self.target_xy[i] = (target.x, target.y)
+            else:
+                self.active[i] = False
+
+    def _step_numpy(self, dt: float):
+        active = self.active
+        diff = self.target_xy - self.pos_xy
+        dist = np.linalg.norm(diff, axis=1)
+        moving = active & (dist > 0)
+        direction = np.zeros_like(diff)
+        direction[moving] = diff[moving] / dist[moving, None]
+
+        humans = active & (self.agent_kind == HUMAN)
+        drones = active & (self.agent_kind == DRONE)
+
+        # Humans walk straight at their (fatigue-reduced) max speed
+        walk = moving & humans
+        current_max_speed = self.max_speed * (1 - self.fatigue)
+        self.vel_xy[walk] = direction[walk] * current_max_speed[walk, None]
+        self.fatigue[humans] = np.minimum(0.5, self.fatigue[humans] + 0.001 * dt)
+
+        # Drones steer towards their desired velocity with bounded acceleration
+        fly = moving & drones
+        desired = direction[fly] * self.max_speed[fly, None]
+        a_max = self.max_accel[fly, None]
+        self.acc_xy[fly] = np.clip(desired - self.vel_xy[fly], -a_max, a_max)
+        self.battery[drones] -= 0.01 * np.linalg.norm(self.vel_xy[drones], axis=1) * dt
+
+        # Integrate and apply air resistance
+        self.vel_xy[active] += self.acc_xy[active] * dt
+        self.pos_xy[active] += self.vel_xy[active] * dt
+        speed = np.linalg.norm(self.vel_xy[active], axis=1)
+        self.vel_xy[active] *= (1 - AIR_RESISTANCE_F32 * speed * dt)[:, None]
+
+        diff = self.target_xy - self.pos_xy
+        self.reached[:] = active & (np.einsum('ij,ij->i', diff, diff) < WAYPOINT_RADIUS_SQ)
+
+    def start(self, duration: float):
+        self.duration = duration
         self.running = True
-        dt = 0.016  # ~60 FPS
-
-        while self.time < duration and self.running:
-            for agent in self.agents:
-                if agent.path:
-                    target = agent.path[0]
-                    agent.calculate_movement(target, dt)
-                    agent.update(dt)
+        self._sync_targets()
 
-                    # Check if reached target
-                    if (target - agent.position).magnitude() < 0.1:
-                        agent.path.pop(0)
+    def step(self, dt: float = SIM_DT):
+        # Advance the simulation by one fixed timestep
+        self._step(dt)
+        self.time += dt
+        if self.time >= self.duration:
+            self.stop()
 
-            self.time += dt
-            await asyncio.sleep(dt)
+    def run_headless(self, duration: float, dt: float = SIM_DT):
+        # Run to completion as fast as possible, without any rendering
+        self.start(duration)
+        while self.running:
+            self.step(dt)
 
     def stop(self):
         self.running = False
+        self._sync_agents()
 
 
 class Visualizer:
@@ -199,14 +344,28 @@ class Visualizer:
         self.screen = pygame.display.set_mode((800, 600))
         self.clock = pygame.time.Clock()
         self.scale = 10  # pixels per meter
+        self._background = pygame.Surface(self.screen.get_size())
+        self._sprites = {}  # render_color -> circle sprite
+
+    @staticmethod
+    def _make_circle_sprite(color, radius):
+        # Pre-rasterized circle, blitted instead of redrawn every frame
+        sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return sprite
 
     def run(self):
+        # Fixed-timestep loop: the simulation always advances in SIM_DT steps,
+        # as many as the elapsed frame time allows
+        accumulator = 0.0
         while self.simulation.running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.simulation.stop()
 
-            self.screen.fill((255, 255, 255))
+            while accumulator >= SIM_DT and self.simulation.running:
+                self.simulation.step(SIM_DT)
+                accumulator -= SIM_DT
 
             # Draw environment
             self._draw_environment()
@@ -215,45 +374,52 @@ class Visualizer:
             self._draw_agents()
 
             pygame.display.flip()
-            self.clock.tick(60)
+            accumulator += self.clock.tick(60) / 1000.0
 
-    def _draw_environment(self):
-        # Draw terrain
-        for pos, terrain_type in self.simulation.environment.terrain.items():
-            color = {
-                TerrainType.PAVEMENT: (200, 200, 200),
-                TerrainType.GRASS: (100, 200, 100),
-                TerrainType.GRAVEL: (150, 150, 150)
-            }[terrain_type]
-            pygame.draw.rect(self.screen, color,
-                             (pos[0] * self.scale, pos[1] * self.scale,
-                              self.scale, self.scale))
-
-        # Draw obstacles
-        for pos, size in self.simulation.environment.obstacles:
-            pygame.draw.rect(self.screen, (100, 100, 100),
+    def _render_background(self):
+        # Terrain, obstacles and bins never move, so draw them once into a cached surface
+        environment = self.simulation.environment
+        self._background.fill((255, 255, 255))
+
+        # Map cell codes to colours and upscale each cell to scale x scale pixels
+        rgb = TERRAIN_COLOR[environment.terrain]
+        rgb = np.repeat(np.repeat(rgb, self.scale, axis=0), self.scale, axis=1)
+        self._background.blit(pygame.surfarray.make_surface(rgb), (0, 0))
+
+        for pos, size in environment.obstacles:
+            pygame.draw.rect(self._background, (100, 100, 100),
                              (pos.x * self.scale, pos.y * self.scale,
                               size.x * self.scale, size.y * self.scale))
 
-        # Draw trash and bins
+        for pos in environment.bins:
+            pygame.draw.rect(self._background, (0, 255, 0),
+                             (pos.x * self.scale - 5, pos.y * self.scale - 5, 10, 10))
+
+        environment.static_dirty = False
+
+    def _draw_environment(self):
+        if self.simulation.environment.static_dirty:
+            self._render_background()
+        self.screen.blit(self._background, (0, 0))
+
+        # Draw trash
         for pos, _ in self.simulation.environment.trash_items:
             pygame.draw.circle(self.screen, (255, 0, 0),
                                (int(pos.x * self.scale), int(pos.y * self.scale)), 3)
 
-        for pos in self.simulation.environment.bins:
-            pygame.draw.rect(self.screen, (0, 255, 0),
-                             (pos.x * self.scale - 5, pos.y * self.scale - 5, 10, 10))
-
     def _draw_agents(self):
-        for agent in self.simulation.agents:
-            color = (0, 0, 255) if isinstance(agent, Human) else (255, 165, 0)
-            pygame.draw.circle(self.screen, color,
-                               (int(agent.position.x * self.scale),
-                                int(agent.position.y * self.scale)), 5)
+        # One blits() call for all agents; sprites are 11x11, so offset by the radius
+        blits = []
+        for agent, (x, y) in zip(self.simulation.agents, self.simulation.pos_xy):
+            sprite = self._sprites.get(agent.render_color)
+            if sprite is None:
+                sprite = self._sprites[agent.render_color] = self._make_circle_sprite(agent.render_color, 5)
+            blits.append((sprite, (int(x * self.scale) - 5, int(y * self.scale) - 5)))
+        self.screen.blits(blits, doreturn=False)
 
 
 # Example usage
-async def main():
+def main():
     # Create environment
     env = Environment(80, 60)
 
@@ -290,11 +456,9 @@ async def main():
     vis = Visualizer(sim)
 
     # Run simulation and visualization
-    await asyncio.gather(
-        sim.run(60.0),  # Run for 60 seconds
-        asyncio.to_thread(vis.run)
-    )
+    sim.start(60.0)  # Run for 60 seconds
+    vis.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,8 +1,8 @@
 # environment.py
-import random
+import numpy as np
+from scipy.spatial import cKDTree
 
 from trash import Trash
-from utils import distance
 
 class Environment:
     def __init__(self, width = 50, height = 50, number_of_trash = 20, bin_position = (0,0)):
@@ -13,25 +13,99 @@ class Environment:
         self.generate_trash()
         self.bin_position = bin_position
 
+        # KD-tree over trash_list; picked-up items are only flagged in _removed
+        # and dropped from trash_list when the tree is rebuilt
+        self._tree = None
+        self._removed = np.zeros(0, dtype=bool)
+        self._removed_count = 0
+
 
     def generate_trash(self):
-        for i in range(self.number_of_trash):
-            x = random.uniform(0, self.width)
-            y = random.uniform(0, self.height)
-            self.trash_list.append(Trash(x,y))
+        xs = np.random.uniform(0, self.width, self.number_of_trash)
+        ys = np.random.uniform(0, self.height, self.number_of_trash)
+        self.trash_list.extend(Trash(x, y) for x, y in zip(xs.tolist(), ys.tolist()))
+
+    def remaining_trash(self):
+        """Number of trash items that have not been picked up yet."""
+        return len(self.trash_list) - self._removed_count
+
+    def _build_index(self):
+        """Drops the removed trash from trash_list and re-indexes what is left."""
+        n_indexed = len(self._removed)
+        self.trash_list = [trash for i, trash in enumerate(self.trash_list)
+                           if i >= n_indexed or not self._removed[i]]
+        self._tree = cKDTree([(trash.x, trash.y) for trash in self.trash_list])
+        self._removed = np.zeros(len(self.trash_list), dtype=bool)
+        self._removed_count = 0
+
+    def _refresh_index(self):
+        # Rebuild when trash was added from outside or too many entries are stale
+        if (self._tree is None or self._tree.n != len(self.trash_list)
+                or self._removed_count > 0.25 * self._tree.n):
+            self._build_index()
+
+    def _nearest_alive(self, points):
+        """For each (x, y) in points, the distance and index of the closest trash not yet removed."""
+        distances = np.empty(len(points))
+        indices = np.empty(len(points), dtype=int)
+
+        # Query more neighbours for the points whose candidates were all removed
+        todo = np.arange(len(points))
+        k = 1
+        while todo.size:
+            k = min(k, self._tree.n)
+            d, idx = self._tree.query(points[todo], k=k)
+            d = d.reshape(len(todo), -1)
+            idx = idx.reshape(len(todo), -1)
+            alive = ~self._removed[idx]
+            found = alive.any(axis=1)
+            first = alive.argmax(axis=1)[found]
+            distances[todo[found]] = d[found, first]
+            indices[todo[found]] = idx[found, first]
+            todo = todo[~found]
+            k *= 2
+        return distances, indices
+
+    def _remove(self, i):
+        self._removed[i] = True
+        self._removed_count += 1
 
     def closest_trash(self, x, y):
         """Finds and removes the closest trash to the given (x, y) coordinates.
            Returns a tuple (closest_trash, distance)."""
-        if not self.trash_list:  # Check if the list is empty
+        if self.remaining_trash() <= 0:  # Check if there is any trash left
             return None, None
 
-        # Find the closest trash and its distance
-        closest_trash = min(self.trash_list, key=lambda trash: distance(x, y, trash.x, trash.y))
-        closest_distance = distance(x, y, closest_trash.x, closest_trash.y)
+        self._refresh_index()
+        distances, indices = self._nearest_alive(np.array([(x, y)], dtype=float))
+        closest_trash = self.trash_list[indices[0]]
+
+        # Remove it from the index
+        self._remove(indices[0])
+
+        return closest_trash, float(distances[0])
+
+    def closest_trash_batch(self, positions):
+        """Finds and removes the closest trash for every (x, y) in positions at once.
+           When several positions want the same item the nearest one gets it and the
+           others take their next closest. Returns a list of (trash, distance) tuples,
+           with (None, None) for positions left over once the trash runs out."""
+        results = [(None, None)] * len(positions)
+        points = np.asarray(positions, dtype=float).reshape(-1, 2)
+        pending = np.arange(len(points))
 
-        # Remove it from the list
-        self.trash_list.remove(closest_trash)
+        while pending.size and self.remaining_trash() > 0:
+            self._refresh_index()
+            distances, indices = self._nearest_alive(points[pending])
 
-        return closest_trash, closest_distance
+            losers = []
+            for j in np.argsort(distances, kind="stable"):
+                i = indices[j]
+                if self._removed[i]:
+                    losers.append(pending[j])
+                    continue
+                self._remove(i)
+                results[pending[j]] = (self.trash_list[i], float(distances[j]))
+            pending = np.array(losers, dtype=int)
 
+        return results
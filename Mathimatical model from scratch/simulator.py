@@ -1,5 +1,6 @@
 # simulator.py
 import copy
+import heapq
 
 from environment import Environment
 from utils import time_to_travel
@@ -15,27 +16,55 @@ class Simulator:
 
 
     # notice that the collection algorithm currently is working on the greedy algorithm at the moment
-    # TODO this will only work with one collector. need to change the code to be able to handle multiple collectors
+    # calc_time handles a single collector; calc_time_multi runs several at once
     def calc_time(self, collector, environment):
-        for i in range(len(environment.number_of_trash)):
+        while environment.remaining_trash() > 0:
             # find the trash that is closest and how close it is
             trash, distance = environment.closest_trash(collector.x, collector.y)
+            self.visit(collector, trash, distance, environment)
 
-            #simulate going to the trash
-            collector.x = trash.x
-            collector.y = trash.y
-            collector.total_time += time_to_travel(distance, collector.speed)
+    @staticmethod
+    def visit(collector, trash, distance, environment):
+        """Moves the collector to the trash and picks it up, returning home when full."""
+        #simulate going to the trash
+        collector.x = trash.x
+        collector.y = trash.y
+        collector.total_time += time_to_travel(distance, collector.speed)
 
-            # if there is too much weight then leave the trash and return home
-            if collector.current_weight >= collector.max_weight:
-                environment.trash_list.append(trash)
-                collector.return_home(*environment.bin_position)
-                continue
+        # if there is too much weight then leave the trash and return home; an empty
+        # collector always takes the item, so every trip picks up at least one
+        if collector.current_items > 0 and collector.current_weight >= collector.capacity_kg:
+            environment.trash_list.append(trash)
+            collector.return_home(*environment.bin_position)
+            return
 
-            # simulate picking up the trash
-            collector.current_items += 1
-            collector.current_weight += trash.weight
+        # simulate picking up the trash
+        collector.current_items += 1
+        collector.current_weight += trash.weight
 
-            # if we reached the maximum amount of trash items need to return home
-            if collector.current_items >= collector.max_items:
-                collector.return_home(*environment.bin_position)
\ No newline at end of file
+        # if we reached the maximum amount of trash items need to return home
+        if collector.current_items >= collector.capacity_items:
+            collector.return_home(*environment.bin_position)
+
+    # greedy collection with several collectors working in parallel: the collector that is
+    # free first heads to its closest remaining trash. Collectors free at the same time are
+    # dispatched together, and a contested item goes to the collector nearest to it
+    def calc_time_multi(self, collectors, environment):
+        # (time the collector is free, collector index)
+        free_heap = [(collector.total_time, i) for i, collector in enumerate(collectors)]
+        heapq.heapify(free_heap)
+
+        while environment.remaining_trash() > 0:
+            free_at, i = heapq.heappop(free_heap)
+            batch = [i]
+            while free_heap and free_heap[0][0] == free_at:
+                batch.append(heapq.heappop(free_heap)[1])
+
+            picks = environment.closest_trash_batch([(collectors[j].x, collectors[j].y) for j in batch])
+            for j, (trash, distance) in zip(batch, picks):
+                if trash is not None:
+                    self.visit(collectors[j], trash, distance, environment)
+                heapq.heappush(free_heap, (collectors[j].total_time, j))
+
+        # the makespan: every collector works in parallel from time 0
+        return max(collector.total_time for collector in collectors)
@@ -10,52 +10,50 @@ Run this script to launch the PyQt6 GUI.
 """
 
 import sys
+import functools
 import math
+import queue
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 import numpy as np
-import matplotlib.pyplot as plt
 
 # PyQt6 imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QFormLayout, QLineEdit,
     QPushButton, QHBoxLayout, QVBoxLayout, QMessageBox, QCheckBox,
-    QSpinBox, QComboBox, QSizePolicy
+    QSpinBox, QComboBox, QSizePolicy, QLabel
 )
 from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtGui import QAction
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle, Circle
+from matplotlib.patches import Rectangle
+
+# Helpers shared with the command-line analysis in logic.py
+from logic import MARKER_POINT_LIMIT, decimate, get_inefficiency_factor, inclusive_range
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 
 ###############################################################################
 # Business Simulation Functions (Static Analysis)
 ###############################################################################
-def get_inefficiency_factor(search_algorithm):
-    """
-    Returns an inefficiency factor based on the search algorithm string.
-    Lower factor means a more efficient path plan.
-    """
-    algo = search_algorithm.lower()
-    if "random" in algo:
-        return 1.5
-    elif "grid" in algo:
-        return 1.0
-    elif "ai" in algo:
-        return 0.8
-    else:
-        return 1.2  # default
-
-
 def compute_trip_distance(capacity, width, height, bin_location, ineff_factor, beta=0.75):
     """
     Estimate the trip distance (meters) for one trip to collect up to 'capacity' trash items.
     Uses a TSP–inspired scaling law.
     """
+    # Scalar inputs only (see business_event_metrics), so plain math beats NumPy's 0-d arrays
     area = width * height
-    tsp_length = beta * np.sqrt(capacity * area)
+    tsp_length = beta * math.sqrt(capacity * area)
     center = (width / 2.0, height / 2.0)
-    d_center = np.sqrt((bin_location[0] - center[0]) ** 2 + (bin_location[1] - center[1]) ** 2)
+    d_center = math.hypot(bin_location[0] - center[0], bin_location[1] - center[1])
     return ineff_factor * (tsp_length + d_center)
 
 
@@ -63,8 +61,8 @@ def compute_event_time(total_trash, capacity, num_agents, speed, width, height,
     """
     Compute the collection time (in hours) for one event.
     """
-    trips_total = np.ceil(total_trash / capacity)
-    trips_per_agent = np.ceil(trips_total / num_agents)
+    trips_total = math.ceil(total_trash / capacity)
+    trips_per_agent = math.ceil(trips_total / num_agents)
     trip_distance = compute_trip_distance(capacity, width, height, bin_location, ineff_factor)
     trip_time_seconds = trip_distance / speed  # seconds per trip
     return (trips_per_agent * trip_time_seconds) / 3600.0  # convert to hours
@@ -86,73 +84,184 @@ def breakeven_days(initial_drone_cost_total, human_event_cost, drone_event_cost,
     return initial_drone_cost_total / (cost_diff * events_per_day)
 
 
-def run_business_simulation(params, flex_param_name, flex_range):
+def check_time_frame_range(start, stop, step):
+    """Raises a ValueError naming the field when the time frame range cannot be swept."""
+    for name, value in (("time_frame_start", start), ("time_frame_stop", stop)):
+        if not math.isfinite(value):
+            raise ValueError(f"Field {name}: must be a finite number")
+    if not (math.isfinite(step) and step > 0):
+        raise ValueError("Field time_frame_step: must be a positive finite number")
+
+
+@functools.lru_cache(maxsize=4096)
+def business_event_metrics(drone_speed, human_speed, total_trash, width, height, drone_capacity, human_capacity,
+                           num_drones, num_humans, search_algorithm, bin_x, bin_y, hourly_drone_cost,
+                           hourly_human_cost):
     """
-    For each value in flex_range (which in this version is always 'time_frame'),
-    update the simulation parameter and compute:
-      - Total collection time (in hours) over the entire time frame
-      - Total cost over the entire time frame
-    (Assuming one collection event per day.)
-    Returns a list of result dictionaries.
+    Drone and human collection time (hours) and cost for a single event. Results are
+    cached, so re-running the analysis with the same inputs skips the computation.
+    Returns (drone_time, human_time, drone_cost, human_cost).
     """
-    results = []
-    ineff_factor = get_inefficiency_factor(params["search_algorithm"])
-    # Compute per-event (single-day) values.
+    ineff_factor = get_inefficiency_factor(search_algorithm)
     drone_time_event = compute_event_time(
-        total_trash=params["total_trash"],
-        capacity=params["drone_capacity"],
-        num_agents=params["num_drones"],
-        speed=params["drone_speed"],
-        width=params["width"],
-        height=params["height"],
-        bin_location=params["bin_location"],
+        total_trash=total_trash,
+        capacity=drone_capacity,
+        num_agents=num_drones,
+        speed=drone_speed,
+        width=width,
+        height=height,
+        bin_location=(bin_x, bin_y),
         ineff_factor=ineff_factor
     )
     human_time_event = compute_event_time(
-        total_trash=params["total_trash"],
-        capacity=params["human_capacity"],
-        num_agents=params["num_humans"],
-        speed=params["human_speed"],
-        width=params["width"],
-        height=params["height"],
-        bin_location=params["bin_location"],
+        total_trash=total_trash,
+        capacity=human_capacity,
+        num_agents=num_humans,
+        speed=human_speed,
+        width=width,
+        height=height,
+        bin_location=(bin_x, bin_y),
         ineff_factor=ineff_factor
     )
-    drone_cost_event = compute_event_cost(drone_time_event, params["num_drones"], params["hourly_drone_cost"])
-    human_cost_event = compute_event_cost(human_time_event, params["num_humans"], params["hourly_human_cost"])
+    drone_cost_event = compute_event_cost(drone_time_event, num_drones, hourly_drone_cost)
+    human_cost_event = compute_event_cost(human_time_event, num_humans, hourly_human_cost)
+    return drone_time_event, human_time_event, drone_cost_event, human_cost_event
+
+
+def run_business_simulation(params, flex_param_name, flex_range):
+    """
+    For each value in flex_range (which in this version is always 'time_frame'),
+    update the simulation parameter and compute:
+      - Total collection time (in hours) over the entire time frame
+      - Total cost over the entire time frame
+    (Assuming one collection event per day.)
+    Returns a dictionary of result arrays (one entry per flex_range value).
+    """
+    # Per-event (single-day) values.
+    drone_time_event, human_time_event, drone_cost_event, human_cost_event = business_event_metrics(
+        params["drone_speed"], params["human_speed"], params["total_trash"], params["width"], params["height"],
+        params["drone_capacity"], params["human_capacity"], params["num_drones"], params["num_humans"],
+        params["search_algorithm"], params["bin_location"][0], params["bin_location"][1],
+        params["hourly_drone_cost"], params["hourly_human_cost"])
 
     # Since flex_param_name is always "time_frame", we scale by the number of days (events per day = 1).
-    for val in flex_range:
-        unit = params["time_frame_unit"]
-        if unit.lower().startswith("day"):
-            events = val  # val is in days
-        elif unit.lower().startswith("month"):
-            events = val * 30
-        elif unit.lower().startswith("year"):
-            events = val * 365
-        else:
-            events = val
-        total_drone_time = drone_time_event * events
-        total_human_time = human_time_event * events
-        total_drone_cost = drone_cost_event * events + params["num_drones"] * params["initial_drone_cost"]
-        total_human_cost = human_cost_event * events
-        results.append({
-            "time_frame": val,
-            "drone_total_collection_time_hours": total_drone_time,
-            "human_total_collection_time_hours": total_human_time,
-            "drone_total_cost": total_drone_cost,
-            "human_total_cost": total_human_cost
-        })
-    return results
+    # Every metric is linear in the number of events, so the whole sweep is a few array ops.
+    unit = params["time_frame_unit"].lower()
+    if unit.startswith("month"):
+        days_per_unit = 30
+    elif unit.startswith("year"):
+        days_per_unit = 365
+    else:
+        days_per_unit = 1  # days, or unknown unit
+    time_frame = np.asarray(flex_range, dtype=float)
+    events = time_frame * days_per_unit
+    return {
+        "time_frame": time_frame,
+        "drone_total_collection_time_hours": drone_time_event * events,
+        "human_total_collection_time_hours": human_time_event * events,
+        "drone_total_cost": drone_cost_event * events + params["num_drones"] * params["initial_drone_cost"],
+        "human_total_cost": human_cost_event * events
+    }
 
 
 ###############################################################################
 # Business Analysis Widget (Static Model)
 ###############################################################################
+@dataclass(frozen=True, slots=True)
+class SimParams:
+    """Typed per-event inputs of the business analysis, as read from the form."""
+    drone_speed: float
+    human_speed: float
+    total_trash: int
+    width: float
+    height: float
+    drone_capacity: int
+    human_capacity: int
+    num_drones: int
+    num_humans: int
+    search_algorithm: str
+    bin_x: float
+    bin_y: float
+    hourly_drone_cost: float
+    hourly_human_cost: float
+    time_frame_unit: str
+    initial_drone_cost: float
+
+    def as_params(self):
+        """The params dictionary expected by run_business_simulation."""
+        params = {f.name: getattr(self, f.name) for f in fields(self)}
+        params["bin_location"] = (params.pop("bin_x"), params.pop("bin_y"))
+        return params
+
+
 class BusinessAnalysisWidget(QWidget):
+    # (label, attribute, default, combo items or None for a line edit), in form order
+    FIELDS = (
+        ("Drone Speed (m/s):", "drone_speed_edit", "16", None),
+        ("Human Speed (m/s):", "human_speed_edit", "1.4", None),
+        ("Total Trash Items:", "total_trash_edit", "20", None),
+        ("Area Width (m):", "width_edit", "25", None),
+        ("Area Height (m):", "height_edit", "25", None),
+        ("Drone Capacity (items/trip):", "drone_capacity_edit", "1", None),
+        ("Human Capacity (items/trip):", "human_capacity_edit", "20", None),
+        ("Number of Drones:", "num_drones_edit", "1", None),
+        ("Number of Humans:", "num_humans_edit", "1", None),
+        ("Search Algorithm:", "search_algo_edit", "Grid Search", None),
+        ("Bin Location X (m):", "bin_x_edit", "12.5", None),
+        ("Bin Location Y (m):", "bin_y_edit", "12.5", None),
+        ("Hourly Drone Cost ($):", "hourly_drone_cost_edit", "20", None),
+        ("Hourly Human Cost ($):", "hourly_human_cost_edit", "15", None),
+        ("Initial Drone Cost ($):", "initial_drone_cost_edit", "0", None),
+        # Instead of a single time_frame value, we provide a range for the time frame.
+        ("Time Frame Unit:", "time_frame_unit_combo", "days", ["days", "months", "years"]),
+        ("Time Frame Start:", "time_frame_start_edit", "1", None),
+        ("Time Frame Stop:", "time_frame_stop_edit", "30", None),
+        ("Time Frame Step:", "time_frame_step_edit", "1", None),
+    )
+    # (SimParams field, type, attribute) for the per-event simulation parameters
+    PARAM_SPEC = (
+        ("drone_speed", float, "drone_speed_edit"),
+        ("human_speed", float, "human_speed_edit"),
+        ("total_trash", int, "total_trash_edit"),
+        ("width", float, "width_edit"),
+        ("height", float, "height_edit"),
+        ("drone_capacity", int, "drone_capacity_edit"),
+        ("human_capacity", int, "human_capacity_edit"),
+        ("num_drones", int, "num_drones_edit"),
+        ("num_humans", int, "num_humans_edit"),
+        ("search_algorithm", str, "search_algo_edit"),
+        ("bin_x", float, "bin_x_edit"),
+        ("bin_y", float, "bin_y_edit"),
+        ("hourly_drone_cost", float, "hourly_drone_cost_edit"),
+        ("hourly_human_cost", float, "hourly_human_cost_edit"),
+        ("time_frame_unit", str, "time_frame_unit_combo"),
+        ("initial_drone_cost", float, "initial_drone_cost_edit"),
+    )
+    # (name, type, attribute) for the time frame sweep
+    RANGE_SPEC = (
+        ("time_frame_start", float, "time_frame_start_edit"),
+        ("time_frame_stop", float, "time_frame_stop_edit"),
+        ("time_frame_step", float, "time_frame_step_edit"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_params = {}  # to store parameters for later use in plotting
+        # Typed value of every field, re-parsed only when that field is edited
+        self._parsed = {}
+        self._field_ok = {}
+        self._field_errors = {}
+        self._parse_count = 0
+        self._cached_reads = 0
+        self.running = False
+        # The sweep runs on a worker thread. Workers never touch Qt objects; they
+        # dispatch() callables that ui_timer runs on the GUI thread. The timer only
+        # runs while a job is in flight, so an idle window never wakes up for it.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.ui_queue = queue.Queue()
+        self.ui_timer = QTimer(self)
+        self.ui_timer.setInterval(30)
+        self.ui_timer.timeout.connect(self.drain_ui)
         self.init_ui()
 
     def init_ui(self):
@@ -161,63 +270,42 @@ class BusinessAnalysisWidget(QWidget):
         form_layout = QFormLayout()
         controls_layout = QVBoxLayout()
 
-        # Input fields with defaults matching the Operational Simulator:
-        self.drone_speed_edit = QLineEdit("16")  # m/s
-        self.human_speed_edit = QLineEdit("1.4")  # m/s
-        self.total_trash_edit = QLineEdit("20")
-        self.width_edit = QLineEdit("25")  # m
-        self.height_edit = QLineEdit("25")  # m
-        self.drone_capacity_edit = QLineEdit("1")
-        self.human_capacity_edit = QLineEdit("20")
-        self.num_drones_edit = QLineEdit("1")
-        self.num_humans_edit = QLineEdit("1")
-        self.search_algo_edit = QLineEdit("Grid Search")
-        self.bin_x_edit = QLineEdit("12.5")
-        self.bin_y_edit = QLineEdit("12.5")
-        self.hourly_drone_cost_edit = QLineEdit("20")
-        self.hourly_human_cost_edit = QLineEdit("15")
-
-        # Instead of a single time_frame value, we now provide a range for the time frame.
-        self.time_frame_unit_combo = QComboBox()
-        self.time_frame_unit_combo.addItems(["days", "months", "years"])
-        self.time_frame_unit_combo.setCurrentText("days")
-        self.time_frame_start_edit = QLineEdit("1")
-        self.time_frame_stop_edit = QLineEdit("30")
-        self.time_frame_step_edit = QLineEdit("1")
-        self.initial_drone_cost_edit = QLineEdit("0")
-
-        # Add form rows
-        form_layout.addRow("Drone Speed (m/s):", self.drone_speed_edit)
-        form_layout.addRow("Human Speed (m/s):", self.human_speed_edit)
-        form_layout.addRow("Total Trash Items:", self.total_trash_edit)
-        form_layout.addRow("Area Width (m):", self.width_edit)
-        form_layout.addRow("Area Height (m):", self.height_edit)
-        form_layout.addRow("Drone Capacity (items/trip):", self.drone_capacity_edit)
-        form_layout.addRow("Human Capacity (items/trip):", self.human_capacity_edit)
-        form_layout.addRow("Number of Drones:", self.num_drones_edit)
-        form_layout.addRow("Number of Humans:", self.num_humans_edit)
-        form_layout.addRow("Search Algorithm:", self.search_algo_edit)
-        form_layout.addRow("Bin Location X (m):", self.bin_x_edit)
-        form_layout.addRow("Bin Location Y (m):", self.bin_y_edit)
-        form_layout.addRow("Hourly Drone Cost ($):", self.hourly_drone_cost_edit)
-        form_layout.addRow("Hourly Human Cost ($):", self.hourly_human_cost_edit)
-        form_layout.addRow("Initial Drone Cost ($):", self.initial_drone_cost_edit)
-        form_layout.addRow("Time Frame Unit:", self.time_frame_unit_combo)
-        form_layout.addRow("Time Frame Start:", self.time_frame_start_edit)
-        form_layout.addRow("Time Frame Stop:", self.time_frame_stop_edit)
-        form_layout.addRow("Time Frame Step:", self.time_frame_step_edit)
+        # Input fields with defaults matching the Operational Simulator, built from FIELDS
+        for label, attr, default, items in self.FIELDS:
+            if items is None:
+                widget = QLineEdit(default)
+            else:
+                widget = QComboBox()
+                widget.addItems(items)
+                widget.setCurrentText(default)
+            setattr(self, attr, widget)
+            form_layout.addRow(label, widget)
 
         # Run Analysis Button
         self.run_button = QPushButton("Run Analysis")
         self.run_button.clicked.connect(self.run_analysis)
+        self.status_label = QLabel("")
+
+        # Parse each field when it changes rather than on every run
+        for name, typ, attr in self.PARAM_SPEC + self.RANGE_SPEC:
+            widget = getattr(self, attr)
+            signal = widget.currentTextChanged if isinstance(widget, QComboBox) else widget.textChanged
+            signal.connect(lambda _text, n=name, t=typ, a=attr: self.on_field_change(n, t, a))
+            self.on_field_change(name, typ, attr)
+
         controls_layout.addLayout(form_layout)
         controls_layout.addWidget(self.run_button)
+        controls_layout.addWidget(self.status_label)
         controls_layout.addStretch()
 
         # Matplotlib canvas for plotting results
         self.figure = Figure(figsize=(6, 8))
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setup_plot()
+        # Axes backgrounds without the data lines, captured after every full draw
+        self.backgrounds = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         # Add controls on left and plot on right
         main_layout.addLayout(controls_layout, 1)
@@ -226,69 +314,185 @@ class BusinessAnalysisWidget(QWidget):
     def run_analysis(self):
         try:
             # Build simulation parameters dictionary (all per-event values)
-            params = {
-                "drone_speed": float(self.drone_speed_edit.text()),
-                "human_speed": float(self.human_speed_edit.text()),
-                "total_trash": int(self.total_trash_edit.text()),
-                "width": float(self.width_edit.text()),
-                "height": float(self.height_edit.text()),
-                "drone_capacity": int(self.drone_capacity_edit.text()),
-                "human_capacity": int(self.human_capacity_edit.text()),
-                "num_drones": int(self.num_drones_edit.text()),
-                "num_humans": int(self.num_humans_edit.text()),
-                "search_algorithm": self.search_algo_edit.text(),
-                "bin_location": (float(self.bin_x_edit.text()), float(self.bin_y_edit.text())),
-                "hourly_drone_cost": float(self.hourly_drone_cost_edit.text()),
-                "hourly_human_cost": float(self.hourly_human_cost_edit.text()),
-                "time_frame_unit": self.time_frame_unit_combo.currentText(),
-                "initial_drone_cost": float(self.initial_drone_cost_edit.text())
-            }
-            self.current_params = params  # save for plotting later
+            params = self.gather_params().as_params()
 
             # Always use "time_frame" as the flexible parameter.
             flex_param = "time_frame"
-            start = float(self.time_frame_start_edit.text())
-            stop = float(self.time_frame_stop_edit.text())
-            step = float(self.time_frame_step_edit.text())
-            flex_range = np.arange(start, stop + step / 2, step)
+            start, stop, step = (self.cached_field(name) for name, _, _ in self.RANGE_SPEC)
+            check_time_frame_range(start, stop, step)
+            flex_range = inclusive_range(start, stop, step)
+        except ValueError as e:
+            QMessageBox.critical(self, "Input Error", str(e))
+            return
+        self.current_params = params  # save for plotting later
+
+        # Run the simulation over the time frame range off the GUI thread.
+        self.running = True
+        self.update_run_button()
+        self.status_label.setText("Running analysis...")
+        self.executor.submit(self.analysis_worker, params, flex_param, flex_range)
+        self.ui_timer.start()
+
+    def field_text(self, attr):
+        widget = getattr(self, attr)
+        return widget.currentText() if isinstance(widget, QComboBox) else widget.text()
 
-            # Run the simulation over the time frame range.
+    def parse_field(self, name, typ, attr):
+        try:
+            return typ(self.field_text(attr))
+        except ValueError as e:
+            raise ValueError(f"Field {name}: {e}") from None
+
+    def on_field_change(self, name, typ, attr):
+        self._parse_count += 1
+        try:
+            self._parsed[name] = self.parse_field(name, typ, attr)
+        except ValueError as e:
+            self._field_ok[name] = False
+            self._field_errors[name] = str(e)
+        else:
+            self._field_ok[name] = True
+            self._field_errors.pop(name, None)
+        self.update_run_button()
+
+    def update_run_button(self):
+        # Only runnable while every field holds a valid value and no run is in flight
+        self.run_button.setEnabled(not self.running and all(self._field_ok.values()))
+        self.run_button.setToolTip("\n".join(self._field_errors.values()))
+
+    def cached_field(self, name):
+        """The parsed value of a field; a ValueError carries its parse error."""
+        if not self._field_ok[name]:
+            raise ValueError(self._field_errors[name])
+        self._cached_reads += 1
+        return self._parsed[name]
+
+    def get_validation_cache_stats(self):
+        """Counters for the per-field parse cache, for diagnostics."""
+        return {
+            "parses": self._parse_count,
+            "cached_reads": self._cached_reads,
+            "fields": len(self._field_ok),
+            "invalid": sorted(name for name, ok in self._field_ok.items() if not ok),
+        }
+
+    def gather_params(self):
+        """Builds SimParams from the parsed fields; a ValueError names the first invalid field."""
+        return SimParams(**{name: self.cached_field(name) for name, _, _ in self.PARAM_SPEC})
+
+    def dispatch(self, fn, *args):
+        """Queues fn(*args) to run on the GUI thread; safe to call from any thread."""
+        self.ui_queue.put((fn, args))
+
+    def drain_ui(self):
+        while True:
+            try:
+                fn, args = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+        if not self.running and self.ui_queue.empty():
+            self.ui_timer.stop()
+
+    def analysis_worker(self, params, flex_param, flex_range):
+        # Worker thread: no Qt calls here, only hand the outcome back
+        try:
             results = run_business_simulation(params, flex_param, flex_range)
-            self.plot_results(results)
         except Exception as e:
-            QMessageBox.critical(self, "Input Error", f"An error occurred:\n{e}")
+            self.dispatch(self.analysis_done, None, e)
+        else:
+            self.dispatch(self.analysis_done, results, None)
+
+    def analysis_done(self, results, error):
+        self.running = False
+        self.update_run_button()
+        self.status_label.setText("")
+        if error is not None:
+            QMessageBox.critical(self, "Simulation Error", f"An error occurred:\n{error}")
+        else:
+            self.plot_results(results)
 
-    def plot_results(self, results):
-        # Clear the figure and set up two subplots.
-        self.figure.clear()
-        ax1 = self.figure.add_subplot(211)
-        ax2 = self.figure.add_subplot(212, sharex=ax1)
+    def setup_plot(self):
+        # Axes and lines are created once; plot_results only swaps in new data
+        self.ax1 = self.figure.add_subplot(211)
+        self.ax2 = self.figure.add_subplot(212, sharex=self.ax1)
+
+        # Cumulative collection time.
+        self.drone_time_line, = self.ax1.plot([], [], 'b-o', label="Drones", animated=True)
+        self.human_time_line, = self.ax1.plot([], [], 'r-s', label="Humans", animated=True)
+        self.ax1.set_ylabel("Total Collection Time (hours)")
+        self.ax1.set_title("Effect of Time Frame on Total Collection Time and Cost")
+        self.ax1.legend()
+        self.ax1.grid(True)
+
+        # Cumulative cost.
+        self.drone_cost_line, = self.ax2.plot([], [], 'b-o', label="Drones", animated=True)
+        self.human_cost_line, = self.ax2.plot([], [], 'r-s', label="Humans", animated=True)
+        self.ax2.set_ylabel("Total Cost ($)")
+        self.ax2.legend()
+        self.ax2.grid(True)
+        # Breakeven marker, created once and only moved or hidden per run
+        self.be_line = self.ax2.axvline(0, color='k', linestyle='--', visible=False, animated=True)
 
+    def plot_results(self, results):
         # Extract data from results.
-        x_vals = [r["time_frame"] for r in results]
-        drone_times = [r["drone_total_collection_time_hours"] for r in results]
-        human_times = [r["human_total_collection_time_hours"] for r in results]
-        drone_costs = [r["drone_total_cost"] for r in results]
-        human_costs = [r["human_total_cost"] for r in results]
-
-        # Plot cumulative collection time.
-        ax1.plot(x_vals, drone_times, 'b-o', label="Drones")
-        ax1.plot(x_vals, human_times, 'r-s', label="Humans")
-        ax1.set_ylabel("Total Collection Time (hours)")
-        ax1.set_title("Effect of Time Frame on Total Collection Time and Cost")
-        ax1.legend()
-        ax1.grid(True)
-
-        # Plot cumulative cost.
-        ax2.plot(x_vals, drone_costs, 'b-o', label="Drones")
-        ax2.plot(x_vals, human_costs, 'r-s', label="Humans")
+        x_vals = results["time_frame"]
+        show_markers = len(x_vals) < MARKER_POINT_LIMIT
+        for line, key, marker in ((self.drone_time_line, "drone_total_collection_time_hours", 'o'),
+                                  (self.human_time_line, "human_total_collection_time_hours", 's'),
+                                  (self.drone_cost_line, "drone_total_cost", 'o'),
+                                  (self.human_cost_line, "human_total_cost", 's')):
+            # Long sweeps are thinned and drawn without markers; results keeps the full arrays
+            line.set_data(*decimate(x_vals, results[key]))
+            line.set_marker(marker if show_markers else "None")
+
         unit = self.current_params["time_frame_unit"]
-        ax2.set_xlabel(f"Time Frame ({unit})")
-        ax2.set_ylabel("Total Cost ($)")
-        ax2.legend()
-        ax2.grid(True)
+        be_x = self.find_breakeven(x_vals, results["drone_total_cost"], results["human_total_cost"])
+        if be_x is None:
+            self.be_line.set_visible(False)
+        else:
+            self.be_line.set_xdata([be_x, be_x])
+            self.be_line.set_visible(True)
+            self.status_label.setText(f"Breakeven after about {be_x:.1f} {unit}")
+
+        old_view = self.plot_view()
+        self.ax2.set_xlabel(f"Time Frame ({unit})")
+        for ax in (self.ax1, self.ax2):
+            # visible_only keeps a hidden breakeven line out of the data limits
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+
+        if self.backgrounds is None or self.plot_view() != old_view:
+            # Limits or labels moved, so the static parts need a full redraw
+            self.canvas.draw_idle()
+            return
+        # Only the lines changed: repaint them over the saved axes backgrounds
+        for ax, background in zip((self.ax1, self.ax2), self.backgrounds):
+            self.canvas.restore_region(background)
+            for line in ax.get_lines():
+                ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
 
-        self.canvas.draw()
+    @staticmethod
+    def find_breakeven(x, drone_costs, human_costs):
+        """Time frame at which the cumulative drone cost drops below the human one, or None if not in range."""
+        savings = human_costs - drone_costs
+        if len(x) < 2 or savings[0] >= 0 or savings[-1] < 0:
+            return None
+        # Savings grow linearly with the time frame: interpolate inside the bracketing step
+        idx = int(np.searchsorted(savings, 0.0))
+        x0, x1 = x[idx - 1], x[idx]
+        s0, s1 = savings[idx - 1], savings[idx]
+        return x0 - s0 * (x1 - x0) / (s1 - s0)
+
+    def plot_view(self):
+        return self.ax1.get_xlim(), self.ax1.get_ylim(), self.ax2.get_ylim(), self.ax2.get_xlabel()
+
+    def on_draw(self, event):
+        self.backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax in (self.ax1, self.ax2)]
+        for ax in (self.ax1, self.ax2):
+            for line in ax.get_lines():
+                ax.draw_artist(line)
 
 
 ###############################################################################
@@ -304,7 +508,23 @@ class SimulationEnvironment:
         self.width = width
         self.obstacles = []  # future use
         self.bin_position = (0, 0)
-        self.trash_positions = []
+        # Trash as an (N, 2) array; picked-up items are cleared in the alive mask
+        self.trash_xy = np.zeros((0, 2))
+        self.alive = np.zeros(0, dtype=bool)
+        self._trash_ids = {}
+        self._remaining = 0
+
+    @property
+    def trash_positions(self):
+        """Positions of the trash that has not been picked up yet."""
+        return [tuple(p) for p in self.trash_xy[self.alive].tolist()]
+
+    @trash_positions.setter
+    def trash_positions(self, positions):
+        self.trash_xy = np.array(positions, dtype=float).reshape(-1, 2)
+        self.alive = np.ones(len(self.trash_xy), dtype=bool)
+        self._trash_ids = {tuple(p): i for i, p in enumerate(positions)}
+        self._remaining = len(self.trash_xy)
 
     def generate_random_trash(self, num_trash):
         self.trash_positions = [
@@ -315,6 +535,21 @@ class SimulationEnvironment:
     def set_bin_position(self, position):
         self.bin_position = position
 
+    def remaining_trash(self):
+        return self._remaining
+
+    def trash_index(self, position):
+        """Index of the trash item at position in trash_xy, or -1 if there is none."""
+        return self._trash_ids.get(tuple(position), -1)
+
+    def pick_up(self, idx):
+        """Marks trash item idx as collected. Returns False if it was already gone."""
+        if idx < 0 or not self.alive[idx]:
+            return False
+        self.alive[idx] = False
+        self._remaining -= 1
+        return True
+
 
 class RoutingManager:
     """
@@ -328,13 +563,14 @@ class RoutingManager:
         if not points:
             return [start]
         path = [start]
-        remaining = points.copy()
-        current = start
-        while remaining:
-            nearest = min(remaining, key=lambda p: self.distance(current, p))
-            path.append(nearest)
-            remaining.remove(nearest)
-            current = nearest
+        pts = np.asarray(points, dtype=float)
+        active = np.ones(len(pts), dtype=bool)
+        cx, cy = start
+        for _ in range(len(pts)):
+            j = self.nearest_index(pts, active, cx, cy)
+            active[j] = False
+            path.append(points[j])
+            cx, cy = pts[j]
         if path[-1] != start:
             path.append(start)
         return path
@@ -342,21 +578,30 @@ class RoutingManager:
     def capacity_split_path(self, start, points, capacity):
         if capacity < 1:
             return self.nearest_neighbor(start, points)
-        remaining = points.copy()
         full_path = [start]
-        current = start
+        pts = np.asarray(points, dtype=float)
+        active = np.ones(len(pts), dtype=bool)
+        remaining = len(pts)
         while remaining:
-            chunk = []
-            for _ in range(min(capacity, len(remaining))):
-                nearest = min(remaining, key=lambda p: self.distance(current, p))
-                chunk.append(nearest)
-                remaining.remove(nearest)
-                current = nearest
-            full_path.extend(chunk)
+            cx, cy = start
+            for _ in range(min(capacity, remaining)):
+                j = self.nearest_index(pts, active, cx, cy)
+                active[j] = False
+                full_path.append(points[j])
+                cx, cy = pts[j]
+                remaining -= 1
             full_path.append(start)
-            current = start
         return full_path
 
+    @staticmethod
+    def nearest_index(pts, active, cx, cy):
+        # Closest still-active point, compared on squared distance
+        dx = pts[:, 0] - cx
+        dy = pts[:, 1] - cy
+        d2 = dx * dx + dy * dy
+        d2[~active] = np.inf
+        return int(d2.argmin())
+
     @staticmethod
     def distance(p1, p2):
         return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
@@ -364,7 +609,7 @@ class RoutingManager:
 
 class Agent:
     """
-    Base class for an agent.
+    Base class for an agent: its parameters, route and results. AgentPool does the moving.
     """
 
     def __init__(self, environment: SimulationEnvironment, route=None,
@@ -383,44 +628,6 @@ class Agent:
         self.capacity = capacity
         self.collected_positions = set()
 
-    def update(self, dt):
-        if self.pickup_timer > 0:
-            self.pickup_timer -= dt
-            if self.pickup_timer < 0:
-                self.pickup_timer = 0.0
-        else:
-            self.move_along_route(dt)
-        self.total_time += dt
-
-    def move_along_route(self, dt):
-        if self.position_index >= len(self.route) - 1:
-            return
-        next_pos = self.route[self.position_index + 1]
-        dist = self.distance(self.current_position, next_pos)
-        # Accelerate
-        if self.acceleration:
-            self.speed = min(self.speed + self.acceleration * dt, self.max_speed)
-        step_dist = self.speed * dt
-        if step_dist >= dist:
-            self.current_position = next_pos
-            self.distance_traveled += dist
-            self.position_index += 1
-            # If reached a trash position, "pick it up"
-            if next_pos in self.env.trash_positions:
-                self.env.trash_positions.remove(next_pos)
-                self.collected_positions.add(next_pos)
-                self.pickup_timer = self.pickup_time
-        else:
-            ratio = step_dist / dist
-            nx = self.current_position[0] + ratio * (next_pos[0] - self.current_position[0])
-            ny = self.current_position[1] + ratio * (next_pos[1] - self.current_position[1])
-            self.current_position = (nx, ny)
-            self.distance_traveled += step_dist
-
-    @staticmethod
-    def distance(p1, p2):
-        return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
-
 
 class HumanAgent(Agent):
     """
@@ -432,13 +639,6 @@ class HumanAgent(Agent):
                          capacity=capacity)
         self.fatigue_factor = 0.0005
 
-    def update(self, dt):
-        if self.speed > 0:
-            self.speed -= self.speed * self.fatigue_factor * dt
-        if self.speed < 0.1:
-            self.speed = 0.1
-        super().update(dt)
-
 
 class DroneAgent(Agent):
     """
@@ -451,9 +651,165 @@ class DroneAgent(Agent):
         self.energy_consumed = 0.0
         self.energy_rate = 1.0
 
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _advance_pool(route, route_len, seg_len, seg_dir, seg_progress, position_index, cur_x, cur_y,
+                      speed, acceleration, max_speed, pickup_timer, distance_traveled, total_time,
+                      is_human, fatigue_factor, energy_rate, energy_consumed, arrived, dt):
+        # One tick for every agent, in place; arrived[i] flags a waypoint reached this tick
+        for i in range(cur_x.shape[0]):
+            arrived[i] = False
+            if is_human[i]:
+                if speed[i] > 0:
+                    speed[i] -= speed[i] * fatigue_factor[i] * dt
+                if speed[i] < 0.1:
+                    speed[i] = 0.1
+            energy_consumed[i] += speed[i] * energy_rate[i] * dt
+
+            if pickup_timer[i] > 0:
+                pickup_timer[i] = max(pickup_timer[i] - dt, 0.0)
+            elif position_index[i] < route_len[i] - 1:
+                k = position_index[i]
+                dist = seg_len[i, k] - seg_progress[i]
+                if acceleration[i] != 0:
+                    speed[i] = min(speed[i] + acceleration[i] * dt, max_speed[i])
+                step_dist = speed[i] * dt
+                if step_dist >= dist:
+                    cur_x[i] = route[i, k + 1, 0]
+                    cur_y[i] = route[i, k + 1, 1]
+                    distance_traveled[i] += dist
+                    seg_progress[i] = 0.0
+                    position_index[i] += 1
+                    arrived[i] = True
+                else:
+                    seg_progress[i] += step_dist
+                    cur_x[i] = route[i, k, 0] + seg_progress[i] * seg_dir[i, k, 0]
+                    cur_y[i] = route[i, k, 1] + seg_progress[i] * seg_dir[i, k, 1]
+                    distance_traveled[i] += step_dist
+            total_time[i] += dt
+
+
+class AgentPool:
+    """
+    Structure-of-arrays state for a group of agents, advanced together with NumPy.
+    Agents only provide their parameters and routes; call sync_agents() to copy
+    the pool state back onto the agent objects.
+    """
+
+    def __init__(self, environment: SimulationEnvironment, agents):
+        self.env = environment
+        self.agents = list(agents)
+        n = len(self.agents)
+
+        # Positions as one (N, 2) array that the scatters read directly; cur_x and cur_y
+        # are views of its columns for the per-axis updates
+        self.xy = np.array([a.current_position for a in self.agents], dtype=float).reshape(n, 2)
+        self.cur_x = self.xy[:, 0]
+        self.cur_y = self.xy[:, 1]
+        self.speed = np.array([a.speed for a in self.agents], dtype=float)
+        self.acceleration = np.array([a.acceleration for a in self.agents], dtype=float)
+        self.max_speed = np.array([a.max_speed for a in self.agents], dtype=float)
+        self.pickup_time = np.array([a.pickup_time for a in self.agents], dtype=float)
+        self.pickup_timer = np.array([a.pickup_timer for a in self.agents], dtype=float)
+        self.distance_traveled = np.array([a.distance_traveled for a in self.agents], dtype=float)
+        self.total_time = np.array([a.total_time for a in self.agents], dtype=float)
+        self.position_index = np.array([a.position_index for a in self.agents], dtype=int)
+        # Per-class behaviour as parameter columns (0 where it does not apply)
+        self.is_human = np.array([isinstance(a, HumanAgent) for a in self.agents], dtype=bool)
+        self.fatigue_factor = np.array([getattr(a, "fatigue_factor", 0.0) for a in self.agents], dtype=float)
+        self.energy_rate = np.array([getattr(a, "energy_rate", 0.0) for a in self.agents], dtype=float)
+        self.energy_consumed = np.array([getattr(a, "energy_consumed", 0.0) for a in self.agents], dtype=float)
+
+        # Routes padded to a common length; route_len holds the real lengths
+        self.route_len = np.array([len(a.route) for a in self.agents], dtype=int)
+        self.route = np.zeros((n, max(self.route_len, default=1), 2), dtype=float)
+        for i, agent in enumerate(self.agents):
+            self.route[i, :len(agent.route)] = agent.route
+        # Trash index of every route node (-1 for the bin and other non-trash stops)
+        self.route_trash = np.full(self.route.shape[:2], -1, dtype=int)
+        for i, agent in enumerate(self.agents):
+            self.route_trash[i, :len(agent.route)] = [environment.trash_index(p) for p in agent.route]
+        # Length and unit direction of every route segment; agents only track how far
+        # along their current segment they are
+        seg = np.diff(self.route, axis=1)
+        self.seg_len = np.hypot(seg[..., 0], seg[..., 1])
+        self.seg_dir = np.divide(seg, self.seg_len[..., None], out=np.zeros_like(seg),
+                                 where=self.seg_len[..., None] > 0)
+        rows = np.arange(n)
+        start = self.route[rows, np.minimum(self.position_index, self.route.shape[1] - 1)]
+        self.seg_progress = np.hypot(self.cur_x - start[:, 0], self.cur_y - start[:, 1])
+        self.arrived = np.zeros(n, dtype=bool)
+
     def update(self, dt):
+        if HAVE_NUMBA:
+            _advance_pool(self.route, self.route_len, self.seg_len, self.seg_dir, self.seg_progress,
+                          self.position_index, self.cur_x, self.cur_y, self.speed, self.acceleration,
+                          self.max_speed, self.pickup_timer, self.distance_traveled, self.total_time,
+                          self.is_human, self.fatigue_factor, self.energy_rate, self.energy_consumed,
+                          self.arrived, dt)
+        else:
+            self._update_numpy(dt)
+
+        # If an agent reached a trash position, "pick it up"
+        for i in np.flatnonzero(self.arrived):
+            if self.env.pick_up(self.route_trash[i, self.position_index[i]]):
+                agent = self.agents[i]
+                agent.collected_positions.add(agent.route[self.position_index[i]])
+                self.pickup_timer[i] = self.pickup_time[i]
+
+    def _update_numpy(self, dt):
+        rows = np.arange(len(self.agents))
+
+        # Human fatigue and drone energy use
+        h = self.is_human
+        self.speed[h] -= np.where(self.speed[h] > 0, self.speed[h] * self.fatigue_factor[h] * dt, 0.0)
+        self.speed[h] = np.maximum(self.speed[h], 0.1)
         self.energy_consumed += self.speed * self.energy_rate * dt
-        super().update(dt)
+
+        # Agents picking up trash only count down their timer
+        picking = self.pickup_timer > 0
+        self.pickup_timer[picking] = np.maximum(self.pickup_timer[picking] - dt, 0.0)
+
+        moving = ~picking & (self.position_index < self.route_len - 1)
+        m = rows[moving]
+        if m.size:
+            k = self.position_index[m]
+            dist = self.seg_len[m, k] - self.seg_progress[m]
+
+            accel = self.acceleration[m]
+            self.speed[m] = np.where(accel != 0,
+                                     np.minimum(self.speed[m] + accel * dt, self.max_speed[m]),
+                                     self.speed[m])
+            step_dist = self.speed[m] * dt
+
+            arrived = step_dist >= dist
+            progress = np.where(arrived, 0.0, self.seg_progress[m] + step_dist)
+            self.seg_progress[m] = progress
+            # Progress is 0 on arrival, which leaves the agent exactly on the next node
+            self.xy[m] = self.route[m, k + arrived] + progress[:, None] * self.seg_dir[m, k]
+            self.distance_traveled[m] += np.where(arrived, dist, step_dist)
+            self.position_index[m] += arrived
+            self.arrived[:] = False
+            self.arrived[m] = arrived
+        else:
+            self.arrived[:] = False
+
+        self.total_time += dt
+
+    def finished(self):
+        return self.position_index >= self.route_len - 1
+
+    def sync_agents(self):
+        for i, agent in enumerate(self.agents):
+            agent.current_position = (float(self.cur_x[i]), float(self.cur_y[i]))
+            agent.speed = float(self.speed[i])
+            agent.pickup_timer = float(self.pickup_timer[i])
+            agent.distance_traveled = float(self.distance_traveled[i])
+            agent.total_time = float(self.total_time[i])
+            agent.position_index = int(self.position_index[i])
+            if hasattr(agent, "energy_consumed"):
+                agent.energy_consumed = float(self.energy_consumed[i])
 
 
 class SimulationVisualizer(FigureCanvas):
@@ -469,19 +825,30 @@ class SimulationVisualizer(FigureCanvas):
         self.ax_human.set_aspect('equal', adjustable='box')
         self.ax_drone.set_aspect('equal', adjustable='box')
         self.agents = []
+        self.human_agents = []
+        self.drone_agents = []
+        self.pool = None
         self.env = None
         self.timer = QTimer()
         self.timer.setInterval(50)  # ~20 FPS
         self.timer.timeout.connect(self.update_frame)
         self.last_time = None
-        self.human_patches = []
-        self.drone_patches = []
+        # Physics runs in fixed steps; wall time is banked in time_accum between frames
+        self.dt_fixed = 0.05
+        self.time_accum = 0.0
+        self.human_scat = None
+        self.drone_scat = None
         self.trash_scat_human = None
         self.trash_scat_drone = None
         self.bin_patch_human = None
         self.bin_patch_drone = None
         self.human_info_text = None
         self.drone_info_text = None
+        self._last_human_info = None
+        self._last_drone_info = None
+        # Static parts of the figure, captured after every full draw for blitting
+        self.background = None
+        self.mpl_connect('draw_event', self.on_draw)
 
     def setup_environment(self, env: SimulationEnvironment):
         self.env = env
@@ -501,30 +868,53 @@ class SimulationVisualizer(FigureCanvas):
         self.ax_human.add_patch(self.bin_patch_human)
         self.ax_drone.add_patch(self.bin_patch_drone)
         # Trash scatter
-        hx = [p[0] for p in env.trash_positions]
-        hy = [p[1] for p in env.trash_positions]
-        self.trash_scat_human = self.ax_human.scatter(hx, hy, c='red')
-        self.trash_scat_drone = self.ax_drone.scatter(hx, hy, c='red')
+        trash_xy = env.trash_xy[env.alive]
+        self.trash_scat_human = self.ax_human.scatter(trash_xy[:, 0], trash_xy[:, 1], c='red', animated=True)
+        self.trash_scat_drone = self.ax_drone.scatter(trash_xy[:, 0], trash_xy[:, 1], c='red', animated=True)
         self.human_info_text = self.ax_human.text(0.01, 1.01, "", transform=self.ax_human.transAxes, fontsize=10,
-                                                  color="blue")
+                                                  color="blue", animated=True)
         self.drone_info_text = self.ax_drone.text(0.01, 1.01, "", transform=self.ax_drone.transAxes, fontsize=10,
-                                                  color="green")
+                                                  color="green", animated=True)
+        self._last_human_info = None
+        self._last_drone_info = None
+        self.human_scat = None
+        self.drone_scat = None
         self.draw()
 
     def add_agents(self, human_agents, drone_agents):
-        self.agents = list(human_agents) + list(drone_agents)
-        for agent in human_agents:
-            patch = Circle(agent.current_position, radius=0.3, color='blue')
-            self.ax_human.add_patch(patch)
-            self.human_patches.append(patch)
-        for agent in drone_agents:
-            patch = Circle(agent.current_position, radius=0.3, color='green')
-            self.ax_drone.add_patch(patch)
-            self.drone_patches.append(patch)
+        self.human_agents = list(human_agents)
+        self.drone_agents = list(drone_agents)
+        self.agents = self.human_agents + self.drone_agents
+        self.pool = AgentPool(self.env, self.agents)
+        # One scatter per axes for all of its agents
+        if self.human_scat is not None:
+            self.human_scat.remove()
+            self.drone_scat.remove()
+        human_xy, drone_xy = self.agent_offsets()
+        self.human_scat = self.ax_human.scatter(human_xy[:, 0], human_xy[:, 1], s=60, c='blue', animated=True)
+        self.drone_scat = self.ax_drone.scatter(drone_xy[:, 0], drone_xy[:, 1], s=60, c='green', animated=True)
         self.draw()
 
+    def agent_offsets(self):
+        """Human and drone positions as (N, 2) views of the pool (rows: humans first, then drones)."""
+        offset = len(self.human_agents)
+        return self.pool.xy[:offset], self.pool.xy[offset:]
+
+    def on_draw(self, event):
+        # A full draw (first show, resize, new scene) leaves out the animated artists
+        self.background = self.copy_from_bbox(self.fig.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for ax, artists in ((self.ax_human, [self.trash_scat_human, self.human_scat, self.human_info_text]),
+                            (self.ax_drone, [self.trash_scat_drone, self.drone_scat, self.drone_info_text])):
+            for artist in artists:
+                if artist is not None:
+                    ax.draw_artist(artist)
+
     def start(self):
         self.last_time = time.time()
+        self.time_accum = 0.0
         self.timer.start()
 
     def stop(self):
@@ -532,51 +922,72 @@ class SimulationVisualizer(FigureCanvas):
 
     def update_frame(self):
         current_time = time.time()
-        dt = current_time - self.last_time if self.last_time else 0
+        self.time_accum += current_time - self.last_time if self.last_time else 0
         self.last_time = current_time
 
-        for agent in self.agents:
-            agent.update(dt)
+        pool = self.pool
+        prev_xy = pool.xy.copy()
+        prev_remaining = self.env.remaining_trash()
+        n_steps = int(self.time_accum / self.dt_fixed)
+        self.time_accum -= n_steps * self.dt_fixed
+        for _ in range(n_steps):
+            pool.update(self.dt_fixed)
+            if self.is_done():
+                break
+
+        # Nothing to redraw while every agent is standing still (e.g. all picking up)
+        moved = np.any(pool.xy != prev_xy)
+        trash_changed = self.env.remaining_trash() != prev_remaining
+        if moved or trash_changed:
+            self.render_frame(trash_changed)
+
+        # Stop simulation if all agents are finished or trash is collected.
+        if self.is_done():
+            self.stop()
+            pool.sync_agents()
+            self.print_summary()
+
+    def render_frame(self, trash_changed=True):
+        pool = self.pool
 
-        # Update agent patches
-        for idx, patch in enumerate(self.human_patches):
-            human_agents = [a for a in self.agents if isinstance(a, HumanAgent)]
-            if idx < len(human_agents):
-                patch.center = human_agents[idx].current_position
-        for idx, patch in enumerate(self.drone_patches):
-            drone_agents = [a for a in self.agents if isinstance(a, DroneAgent)]
-            if idx < len(drone_agents):
-                patch.center = drone_agents[idx].current_position
+        # Update agent markers
+        human_xy, drone_xy = self.agent_offsets()
+        self.human_scat.set_offsets(human_xy)
+        self.drone_scat.set_offsets(drone_xy)
 
         # Update trash
-        if self.env:
-            hx = [p[0] for p in self.env.trash_positions]
-            hy = [p[1] for p in self.env.trash_positions]
-            self.trash_scat_human.set_offsets(np.c_[hx, hy])
-            self.trash_scat_drone.set_offsets(np.c_[hx, hy])
+        if self.env and trash_changed:
+            trash_xy = self.env.trash_xy[self.env.alive]
+            self.trash_scat_human.set_offsets(trash_xy)
+            self.trash_scat_drone.set_offsets(trash_xy)
 
         # Update info text (showing first agent stats)
-        human_agents = [a for a in self.agents if isinstance(a, HumanAgent)]
-        drone_agents = [a for a in self.agents if isinstance(a, DroneAgent)]
-        if human_agents:
-            h = human_agents[0]
-            collected = len(h.collected_positions)
-            total = collected + len(self.env.trash_positions)
-            self.human_info_text.set_text(
-                f"Time: {h.total_time:.2f}s\nDistance: {h.distance_traveled:.2f}m\nCollected: {collected}/{total}")
-        if drone_agents:
-            d = drone_agents[0]
-            collected = len(d.collected_positions)
-            total = collected + len(self.env.trash_positions)
-            self.drone_info_text.set_text(
-                f"Time: {d.total_time:.2f}s\nDistance: {d.distance_traveled:.2f}m\nCollected: {collected}/{total}")
-
-        self.draw()
-        # Stop simulation if all agents are finished or trash is collected.
-        done = all(a.position_index >= len(a.route) - 1 for a in self.agents) or len(self.env.trash_positions) == 0
-        if done:
-            self.stop()
-            self.print_summary()
+        if self.human_agents:
+            self._last_human_info = self.update_info(self.human_info_text, self._last_human_info,
+                                                     self.human_agents[0], 0)
+        if self.drone_agents:
+            self._last_drone_info = self.update_info(self.drone_info_text, self._last_drone_info,
+                                                     self.drone_agents[0], len(self.human_agents))
+
+        # Only the moving artists are redrawn over the cached background
+        if self.background is None:
+            self.draw()
+        else:
+            self.restore_region(self.background)
+            self.draw_animated()
+            self.blit(self.fig.bbox)
+
+    def update_info(self, text, last_info, agent, i):
+        """Sets the stats text for pool row i, unless the values shown have not changed."""
+        collected = len(agent.collected_positions)
+        info = (round(float(self.pool.total_time[i]), 2), round(float(self.pool.distance_traveled[i]), 2),
+                collected, collected + self.env.remaining_trash())
+        if info != last_info:
+            text.set_text(f"Time: {info[0]:.2f}s\nDistance: {info[1]:.2f}m\nCollected: {info[2]}/{info[3]}")
+        return info
+
+    def is_done(self):
+        return self.pool.finished().all() or self.env.remaining_trash() == 0
 
     def print_summary(self):
         print("\n=== Simulation Complete ===")
@@ -586,10 +997,15 @@ class SimulationVisualizer(FigureCanvas):
 
 
 class OperationalSimulationWidget(QWidget):
+    # Most routes kept in _route_cache; the oldest entry is dropped first
+    ROUTE_CACHE_SIZE = 64
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.env = SimulationEnvironment()
         self.routing_mgr = RoutingManager()
+        # Routes already built, keyed by (bin, trash points, algorithm, capacity)
+        self._route_cache = {}
         self.init_ui()
 
     def init_ui(self):
@@ -679,23 +1095,19 @@ class OperationalSimulationWidget(QWidget):
             n_drones = self.drones_spin.value() if multiple_drones else 1
 
             # Human route using Nearest Neighbor
-            human_route = self.routing_mgr.nearest_neighbor(self.env.bin_position, self.env.trash_positions)
+            human_route = self.get_route("Nearest Neighbor", self.env.trash_positions)
             human_agent = HumanAgent(self.env, route=human_route, speed=human_speed, pickup_time=human_pickup,
                                      capacity=human_capacity)
 
             # Drone agents: split trash by a simple round-robin
-            all_trash = self.env.trash_positions.copy()
-            sorted_trash = sorted(all_trash, key=lambda p: math.hypot(p[0] - self.env.bin_position[0],
-                                                                      p[1] - self.env.bin_position[1]))
-            assignments = [[] for _ in range(n_drones)]
-            for idx, pt in enumerate(sorted_trash):
-                assignments[idx % n_drones].append(pt)
+            # (ordered by squared distance from the bin, which sorts the same as distance)
+            bx, by = self.env.bin_position
+            trash_xy = self.env.trash_xy[self.env.alive]
+            order = np.argsort((trash_xy[:, 0] - bx) ** 2 + (trash_xy[:, 1] - by) ** 2, kind="stable")
+            assignments = [[tuple(p) for p in trash_xy[order[i::n_drones]].tolist()] for i in range(n_drones)]
             drone_agents = []
             for i in range(n_drones):
-                if route_method == "Nearest Neighbor":
-                    route = self.routing_mgr.nearest_neighbor(self.env.bin_position, assignments[i])
-                else:
-                    route = self.routing_mgr.capacity_split_path(self.env.bin_position, assignments[i], drone_capacity)
+                route = self.get_route(route_method, assignments[i], drone_capacity)
                 drone = DroneAgent(self.env, route=route, speed=0.0, acceleration=2.0, max_speed=drone_speed,
                                    pickup_time=drone_pickup, capacity=drone_capacity)
                 drone_agents.append(drone)
@@ -726,6 +1138,23 @@ class OperationalSimulationWidget(QWidget):
         self.env = SimulationEnvironment()
         self.sim_canvas.setup_environment(self.env)
 
+    def get_route(self, route_method, points, capacity=None):
+        """Builds a route from the bin through points, reusing an earlier result for the same inputs."""
+        capacity = capacity if route_method != "Nearest Neighbor" else None
+        # Exact coordinates: the route's waypoints are these very tuples, and pickups
+        # look them up in the environment's trash index by equality
+        key = (tuple(self.env.bin_position), tuple(map(tuple, points)), route_method, capacity)
+        route = self._route_cache.get(key)
+        if route is None:
+            if route_method == "Nearest Neighbor":
+                route = self.routing_mgr.nearest_neighbor(self.env.bin_position, points)
+            else:
+                route = self.routing_mgr.capacity_split_path(self.env.bin_position, points, capacity)
+            if len(self._route_cache) >= self.ROUTE_CACHE_SIZE:
+                self._route_cache.pop(next(iter(self._route_cache)))
+            self._route_cache[key] = route
+        return list(route)
+
     def get_bin_position(self, selection, length, width):
         if selection == "Bottom-Left":
             return (0, 0)
@@ -759,6 +1188,11 @@ class MainWindow(QMainWindow):
         tabs.addTab(self.operational_tab, "Operational Simulation")
         self.setCentralWidget(tabs)
 
+        tools_menu = self.menuBar().addMenu("Tools")
+        clear_cache_action = QAction("Clear Analysis Cache", self)
+        clear_cache_action.triggered.connect(business_event_metrics.cache_clear)
+        tools_menu.addAction(clear_cache_action)
+
 
 ###############################################################################
 # Main Execution
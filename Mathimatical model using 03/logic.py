@@ -10,7 +10,7 @@ varying one input parameter (the “flexible parameter”) affects the performan
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+import functools
 import json
 import csv
 import sys
@@ -20,23 +20,34 @@ import sys
 # Helper functions
 # ---------------------------
 
+# (keyword, factor) checked in order; the first keyword found in the algorithm name wins
+INEFFICIENCY_FACTORS = (("random", 1.5), ("grid", 1.0), ("ai", 0.8))
+DEFAULT_INEFFICIENCY_FACTOR = 1.2  # factor if no keyword is recognized
+
+
+@functools.lru_cache(maxsize=16)
 def get_inefficiency_factor(search_algorithm):
     """
     Return an inefficiency factor based on the search algorithm string.
     (Lower factor means more efficient path planning.)
     """
     algo = search_algorithm.lower()
-    if "random" in algo:
-        return 1.5
-    elif "grid" in algo:
-        return 1.0
-    elif "ai" in algo:
-        return 0.8
-    else:
-        return 1.2  # default factor if not recognized
+    return next((factor for keyword, factor in INEFFICIENCY_FACTORS if keyword in algo),
+                DEFAULT_INEFFICIENCY_FACTOR)
+
+
+def trip_geometry(width, height, bin_location):
+    """
+    The capacity-independent part of a trip: the area and the distance from the bin to
+    the centre of the area. Returned as (area, d_center).
+    """
+    area = width * height
+    center = (width / 2.0, height / 2.0)
+    d_center = np.hypot(bin_location[0] - center[0], bin_location[1] - center[1])
+    return area, d_center
 
 
-def compute_trip_distance(capacity, width, height, bin_location, ineff_factor, beta=0.75):
+def compute_trip_distance(capacity, width, height, bin_location, ineff_factor, beta=0.75, geometry=None):
     """
     Estimate the distance (in meters) traveled in one trip when collecting up to
     'capacity' trash items in an area of size width x height.
@@ -49,16 +60,16 @@ def compute_trip_distance(capacity, width, height, bin_location, ineff_factor, b
     and we add an extra term (the distance from the bin to the tour) approximated by the
     distance from the bin to the center of the area.
     Finally, the search algorithm inefficiency multiplies the route length.
+    'geometry' may pass in a precomputed trip_geometry(width, height, bin_location).
     """
-    area = width * height
+    area, d_center = geometry if geometry is not None else trip_geometry(width, height, bin_location)
     tsp_length = beta * np.sqrt(capacity * area)
-    center = (width / 2.0, height / 2.0)
-    d_center = np.sqrt((bin_location[0] - center[0]) ** 2 + (bin_location[1] - center[1]) ** 2)
     trip_distance = ineff_factor * (tsp_length + d_center)
     return trip_distance
 
 
-def compute_event_time(total_trash, capacity, num_agents, speed, width, height, bin_location, ineff_factor):
+def compute_event_time(total_trash, capacity, num_agents, speed, width, height, bin_location, ineff_factor,
+                       geometry=None):
     """
     Compute the time (in hours) required to collect all trash items during one event.
 
@@ -71,7 +82,7 @@ def compute_event_time(total_trash, capacity, num_agents, speed, width, height,
     trips_total = np.ceil(total_trash / capacity)
     trips_per_agent = np.ceil(trips_total / num_agents)
 
-    trip_distance = compute_trip_distance(capacity, width, height, bin_location, ineff_factor)
+    trip_distance = compute_trip_distance(capacity, width, height, bin_location, ineff_factor, geometry=geometry)
     trip_time_seconds = trip_distance / speed  # seconds for one trip
     total_time_seconds = trips_per_agent * trip_time_seconds
     total_time_hours = total_time_seconds / 3600.0
@@ -98,110 +109,149 @@ def breakeven_days(initial_drone_cost_total, human_event_cost, drone_event_cost,
     return initial_drone_cost_total / (cost_diff * events_per_day)
 
 
+def inclusive_range(start, stop, step):
+    """
+    Values start, start + step, ... up to and including stop (when it lies on the grid).
+    The point count is fixed first and the values come from np.linspace, so float
+    round-off can neither add a spurious extra point nor drop the last one.
+    """
+    n = max(int(np.floor((stop - start) / step + 1e-9)) + 1, 0)
+    return np.linspace(start, start + (n - 1) * step, n)
+
+
+# Longer sweeps are thinned to at most this many plotted points
+MAX_PLOT_POINTS = 2000
+# Point markers are only drawn for sweeps shorter than this
+MARKER_POINT_LIMIT = 200
+
+
+def decimate(x, y, max_pts=MAX_PLOT_POINTS):
+    """
+    Thin a plotted series to at most max_pts points by taking every n-th value.
+    The last point is always kept so the curve still ends where the sweep ends.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= max_pts:
+        return x, y
+    stride = -(-len(x) // max_pts)
+    idx = np.arange(0, len(x), stride)
+    idx[-1] = len(x) - 1
+    return x[idx], y[idx]
+
+
 # ---------------------------
 # Main simulation function
 # ---------------------------
+def _evaluate(params, flex_param_name, flex_values):
+    """
+    Compute (drone_time, human_time, drone_cost, human_cost) with flex_values substituted
+    for the flexible parameter. flex_values may be a single value or a NumPy array, in which
+    case it broadcasts against the other (scalar) inputs.
+    """
+    def value(name):
+        # Read inputs straight from params; only the flexible one is swapped out
+        return flex_values if name == flex_param_name else params[name]
+
+    ineff_factor = get_inefficiency_factor(value("search_algorithm"))
+    # Area and bin offset are shared by drones and humans; with a width, height or bin_location
+    # sweep they are arrays, so compute them once for both
+    geometry = trip_geometry(value("width"), value("height"), value("bin_location"))
+
+    # For drones:
+    drone_time = compute_event_time(
+        total_trash=value("total_trash"),
+        capacity=value("drone_capacity"),
+        num_agents=value("num_drones"),
+        speed=value("drone_speed"),
+        width=value("width"),
+        height=value("height"),
+        bin_location=value("bin_location"),
+        ineff_factor=ineff_factor,
+        geometry=geometry
+    )
+    drone_cost_event = compute_event_cost(drone_time, value("num_drones"), value("hourly_drone_cost"))
+
+    # For humans:
+    human_time = compute_event_time(
+        total_trash=value("total_trash"),
+        capacity=value("human_capacity"),
+        num_agents=value("num_humans"),
+        speed=value("human_speed"),
+        width=value("width"),
+        height=value("height"),
+        bin_location=value("bin_location"),
+        ineff_factor=ineff_factor,
+        geometry=geometry
+    )
+    human_cost_event = compute_event_cost(human_time, value("num_humans"), value("hourly_human_cost"))
+
+    # If the flexible parameter is the time frame, assume one event per day
+    # and scale the cost to the cumulative cost over that time.
+    if flex_param_name == "time_frame":
+        # Determine the number of days in the time frame based on the unit
+        unit = value("time_frame_unit")
+        if unit.lower().startswith("month"):
+            days = value("time_frame") * 30
+        elif unit.lower().startswith("year"):
+            days = value("time_frame") * 365
+        else:
+            days = value("time_frame")  # days, or assume days if unknown
+        # cumulative cost assuming one event per day
+        drone_cost = drone_cost_event * days
+        human_cost = human_cost_event * days
+        # Add initial drone cost if provided
+        if value("initial_drone_cost") > 0:
+            drone_cost = drone_cost + value("num_drones") * value("initial_drone_cost")
+        # The event times are kept as computed (for one event) for reference.
+    else:
+        # For a one–event simulation
+        drone_cost = drone_cost_event
+        human_cost = human_cost_event
+
+    return drone_time, human_time, drone_cost, human_cost
+
+
 def run_simulation(params, flex_param_name, flex_range):
     """
     For each value of the flexible parameter (provided in flex_range) update the simulation
     input 'params' accordingly and compute event time and cost for drones and humans.
 
     Returns:
-      results: a list of dictionaries containing the flexible parameter value and computed metrics.
+      results: a dictionary of arrays (one entry per flex_range value) holding the flexible
+      parameter values and the computed metrics.
     """
-    results = []
-    ineff_factor = get_inefficiency_factor(params["search_algorithm"])
-
-    # For each value in the flexible range, update the parameter and compute metrics.
-    for val in flex_range:
-        # Make a copy of params
-        sim_params = params.copy()
-        sim_params[flex_param_name] = val
-
-        # For drones:
-        drone_time = compute_event_time(
-            total_trash=sim_params["total_trash"],
-            capacity=sim_params["drone_capacity"],
-            num_agents=sim_params["num_drones"],
-            speed=sim_params["drone_speed"],
-            width=sim_params["width"],
-            height=sim_params["height"],
-            bin_location=sim_params["bin_location"],
-            ineff_factor=ineff_factor
-        )
-        drone_cost_event = compute_event_cost(drone_time, sim_params["num_drones"], sim_params["hourly_drone_cost"])
-
-        # For humans:
-        human_time = compute_event_time(
-            total_trash=sim_params["total_trash"],
-            capacity=sim_params["human_capacity"],
-            num_agents=sim_params["num_humans"],
-            speed=sim_params["human_speed"],
-            width=sim_params["width"],
-            height=sim_params["height"],
-            bin_location=sim_params["bin_location"],
-            ineff_factor=ineff_factor
-        )
-        human_cost_event = compute_event_cost(human_time, sim_params["num_humans"], sim_params["hourly_human_cost"])
-
-        # If the flexible parameter is the time frame, assume one event per day
-        # and scale the cost to the cumulative cost over that time.
-        if flex_param_name == "time_frame":
-            # Determine the number of days in the time frame based on the unit
-            unit = sim_params["time_frame_unit"]
-            tf_val = val  # the current time frame value
-            if unit.lower().startswith("day"):
-                days = tf_val
-            elif unit.lower().startswith("month"):
-                days = tf_val * 30
-            elif unit.lower().startswith("year"):
-                days = tf_val * 365
-            else:
-                days = tf_val  # assume days if unknown
-            # cumulative cost assuming one event per day
-            drone_total_cost = drone_cost_event * days
-            human_total_cost = human_cost_event * days
-            # Add initial drone cost if provided
-            if sim_params["initial_drone_cost"] > 0:
-                drone_total_cost += sim_params["num_drones"] * sim_params["initial_drone_cost"]
-            # For the “time frame” simulation we record cumulative cost.
-            drone_cost = drone_total_cost
-            human_cost = human_total_cost
-            # We keep the event times as computed (for one event) for reference.
-            drone_time_val = drone_time
-            human_time_val = human_time
-        else:
-            # For a one–event simulation
-            drone_cost = drone_cost_event
-            human_cost = human_cost_event
-            drone_time_val = drone_time
-            human_time_val = human_time
-
-        results.append({
-            flex_param_name: val,
-            "drone_event_time_hours": drone_time_val,
-            "human_event_time_hours": human_time_val,
-            "drone_cost": drone_cost,
-            "human_cost": human_cost
-        })
-    return results
+    # Evaluate the whole range at once as arrays
+    flex_values = np.asarray(flex_range, dtype=np.float64)
+    # Inputs that do not depend on the flexible parameter come out as scalars
+    columns = [np.broadcast_to(c, flex_values.shape)
+               for c in (flex_values,) + _evaluate(params, flex_param_name, flex_values)]
+
+    keys = (flex_param_name, "drone_event_time_hours", "human_event_time_hours", "drone_cost", "human_cost")
+    return dict(zip(keys, columns))
 
 
 # ---------------------------
 # Export functions
 # ---------------------------
+def results_to_records(results):
+    """Turn the dictionary of result arrays into one dictionary per flex value."""
+    columns = {key: np.asarray(values).tolist() for key, values in results.items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
 def export_results_csv(results, filename):
-    keys = results[0].keys()
+    keys = results.keys()
     with open(filename, 'w', newline='') as csvfile:
         dict_writer = csv.DictWriter(csvfile, fieldnames=keys)
         dict_writer.writeheader()
-        dict_writer.writerows(results)
+        dict_writer.writerows(results_to_records(results))
     print(f"Results exported to {filename}")
 
 
 def export_results_json(results, filename):
     with open(filename, 'w') as jsonfile:
-        json.dump(results, jsonfile, indent=4)
+        json.dump(results_to_records(results), jsonfile, indent=4)
     print(f"Results exported to {filename}")
 
 
@@ -253,7 +303,10 @@ def get_user_input():
         stop = float(input(f"Enter ending value for {flex_param}: "))
         step = float(input(f"Enter step value for {flex_param}: "))
 
-        flex_range = np.arange(start, stop + step / 2, step)  # include stop
+        flex_range = inclusive_range(start, stop, step)
+        if isinstance(params[flex_param], int):
+            # Counts (trash, capacities, agents) must stay whole numbers
+            flex_range = np.rint(flex_range).astype(int)
 
         return params, flex_param, flex_range
     except Exception as e:
@@ -265,25 +318,32 @@ def get_user_input():
 # Plotting functions
 # ---------------------------
 def plot_results(results, flex_param_name, params):
-    x = [r[flex_param_name] for r in results]
-    drone_times = [r["drone_event_time_hours"] for r in results]
-    human_times = [r["human_event_time_hours"] for r in results]
-    drone_costs = [r["drone_cost"] for r in results]
-    human_costs = [r["human_cost"] for r in results]
+    # pyplot is imported here so the prompts and sweep do not pay for loading
+    # matplotlib and its backend
+    import matplotlib.pyplot as plt
+
+    x = results[flex_param_name]
+    drone_times = results["drone_event_time_hours"]
+    human_times = results["human_event_time_hours"]
+    drone_costs = results["drone_cost"]
+    human_costs = results["human_cost"]
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 10), sharex=True)
 
+    # Long sweeps are thinned and drawn as plain lines; the breakeven below uses the full arrays
+    drone_style, human_style = ('b-o', 'r-s') if len(x) < MARKER_POINT_LIMIT else ('b-', 'r-')
+
     # Plot Time taken for collection (in hours)
-    ax1.plot(x, drone_times, 'b-o', label="Drones")
-    ax1.plot(x, human_times, 'r-s', label="Humans")
+    ax1.plot(*decimate(x, drone_times), drone_style, label="Drones")
+    ax1.plot(*decimate(x, human_times), human_style, label="Humans")
     ax1.set_ylabel("Event Collection Time (hours)")
     ax1.set_title(f"Effect of {flex_param_name} on Collection Time and Cost")
     ax1.legend()
     ax1.grid(True)
 
     # Plot total cost of operation
-    ax2.plot(x, drone_costs, 'b-o', label="Drones")
-    ax2.plot(x, human_costs, 'r-s', label="Humans")
+    ax2.plot(*decimate(x, drone_costs), drone_style, label="Drones")
+    ax2.plot(*decimate(x, human_costs), human_style, label="Humans")
     ax2.set_xlabel(f"{flex_param_name}")
     ax2.set_ylabel("Cost ($)")
     ax2.legend()
@@ -291,45 +351,33 @@ def plot_results(results, flex_param_name, params):
 
     # If the flexible parameter is time_frame and initial cost is provided, add breakeven analysis.
     if flex_param_name == "time_frame" and params["initial_drone_cost"] > 0:
-        # Use the first (baseline) event cost computed at the baseline parameter value
-        ineff_factor = get_inefficiency_factor(params["search_algorithm"])
-        drone_time_event = compute_event_time(
-            total_trash=params["total_trash"],
-            capacity=params["drone_capacity"],
-            num_agents=params["num_drones"],
-            speed=params["drone_speed"],
-            width=params["width"],
-            height=params["height"],
-            bin_location=params["bin_location"],
-            ineff_factor=ineff_factor
-        )
-        drone_cost_event = compute_event_cost(drone_time_event, params["num_drones"], params["hourly_drone_cost"])
-        human_time_event = compute_event_time(
-            total_trash=params["total_trash"],
-            capacity=params["human_capacity"],
-            num_agents=params["num_humans"],
-            speed=params["human_speed"],
-            width=params["width"],
-            height=params["height"],
-            bin_location=params["bin_location"],
-            ineff_factor=ineff_factor
-        )
-        human_cost_event = compute_event_cost(human_time_event, params["num_humans"], params["hourly_human_cost"])
-
-        # Assume one event per day.
-        initial_drone_cost_total = params["num_drones"] * params["initial_drone_cost"]
-        be_days = breakeven_days(initial_drone_cost_total, human_cost_event, drone_cost_event, events_per_day=1)
-        if be_days is not None:
-            # Plot a vertical dashed line at the breakeven day (if within the plotted range)
-            if x[0] <= be_days <= x[-1]:
-                ax2.axvline(x=be_days, color='k', linestyle='--', label=f"Breakeven at {be_days:.1f} days")
+        # Cumulative savings of drones over humans at each time frame (negative while the
+        # initial drone cost is not yet paid back). With one event per day they grow linearly,
+        # so the breakeven is where this line crosses zero.
+        savings = np.asarray(human_costs) - np.asarray(drone_costs)
+        unit = params["time_frame_unit"]
+        if len(x) < 2:
+            print("Breakeven analysis needs at least two time frame values.")
+        elif savings[-1] > savings[0]:
+            # Bracket the zero crossing (or extend the nearest segment) and interpolate
+            idx = int(np.clip(np.searchsorted(savings, 0.0), 1, len(x) - 1))
+            x0, x1 = x[idx - 1], x[idx]
+            s0, s1 = savings[idx - 1], savings[idx]
+            be_x = x0 - s0 * (x1 - x0) / (s1 - s0)
+            if x[0] <= be_x <= x[-1]:
+                # Plot a vertical dashed line at the breakeven point
+                ax2.axvline(x=be_x, color='k', linestyle='--', label=f"Breakeven at {be_x:.1f} {unit}")
                 ax2.legend()
-            print(f"Breakeven analysis: Drones become cost-effective after approximately {be_days:.1f} days.")
+            print(f"Breakeven analysis: Drones become cost-effective after approximately {be_x:.1f} {unit}.")
         else:
             print("No breakeven point found (drones are not operationally cheaper per event).")
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    try:
+        plt.show()
+    finally:
+        # Release pyplot's reference so repeated plots do not pile up figures
+        plt.close(fig)
 
 
 # ---------------------------
@@ -343,11 +391,11 @@ def main():
     results = run_simulation(params, flex_param_name, flex_range)
 
     # Print summary for the first simulation (as an example)
-    print("\nExample simulation result for flexible parameter = {:.3f}:".format(results[0][flex_param_name]))
-    print("  Drone event time (hours): {:.4f}".format(results[0]["drone_event_time_hours"]))
-    print("  Human event time (hours): {:.4f}".format(results[0]["human_event_time_hours"]))
-    print("  Drone cost for event: ${:.2f}".format(results[0]["drone_cost"]))
-    print("  Human cost for event: ${:.2f}".format(results[0]["human_cost"]))
+    print("\nExample simulation result for flexible parameter = {:.3f}:".format(results[flex_param_name][0]))
+    print("  Drone event time (hours): {:.4f}".format(results["drone_event_time_hours"][0]))
+    print("  Human event time (hours): {:.4f}".format(results["human_event_time_hours"][0]))
+    print("  Drone cost for event: ${:.2f}".format(results["drone_cost"][0]))
+    print("  Human cost for event: ${:.2f}".format(results["human_cost"][0]))
 
     # Plot results
     plot_results(results, flex_param_name, params)
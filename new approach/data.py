@@ -1,8 +1,9 @@
-import random
+import numpy as np
 
-def generate_trash_locations(width, height, num_trash):
+def generate_trash_locations(width, height, num_trash, rng=None):
     """
-    Generate a list of trash locations (x, y) coordinates within the specified area.
-    All coordinates are in meters.
+    Generate trash locations within the specified area as an (num_trash, 2) array of
+    (x, y) coordinates. All coordinates are in meters.
     """
-    return [(random.uniform(0, width), random.uniform(0, height)) for _ in range(num_trash)]
+    rng = rng or np.random.default_rng()
+    return rng.random((num_trash, 2)) * (width, height)
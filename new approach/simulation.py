@@ -1,4 +1,71 @@
+import heapq
 import math
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _concurrency_core(trash, num_agents, speed_m_s, capacity, start_x, start_y):
+        # Same event loop as concurrency_simulation, on per-agent arrays. trash is an (m, 2)
+        # array that is consumed in place: a picked item is overwritten by the last live one.
+        # free_at holds the absolute time each agent becomes free, so nothing has to be
+        # subtracted from every agent when the clock advances
+        pos_x = np.full(num_agents, start_x)
+        pos_y = np.full(num_agents, start_y)
+        free_at = np.zeros(num_agents)
+        total_distance = np.zeros(num_agents)
+        capacity_used = np.zeros(num_agents, dtype=np.int64)
+        m = trash.shape[0]
+
+        while m > 0:
+            # Agent counts are small, so a linear scan beats a heap here
+            i_min = 0
+            for i in range(1, num_agents):
+                if free_at[i] < free_at[i_min]:
+                    i_min = i
+            px = pos_x[i_min]
+            py = pos_y[i_min]
+
+            # Closest trash by squared distance; only the winner needs a sqrt
+            closest_idx = 0
+            best_d2 = np.inf
+            for j in range(m):
+                dx = trash[j, 0] - px
+                dy = trash[j, 1] - py
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    closest_idx = j
+            closest_dist = math.sqrt(best_d2)
+
+            tx = trash[closest_idx, 0]
+            ty = trash[closest_idx, 1]
+            trash[closest_idx, 0] = trash[m - 1, 0]
+            trash[closest_idx, 1] = trash[m - 1, 1]
+            m -= 1
+
+            free_at[i_min] += closest_dist / speed_m_s
+            total_distance[i_min] += closest_dist
+            pos_x[i_min] = tx
+            pos_y[i_min] = ty
+
+            if capacity > 0:
+                capacity_used[i_min] += 1
+                if capacity_used[i_min] >= capacity:
+                    dist_back = math.sqrt((tx - start_x) ** 2 + (ty - start_y) ** 2)
+                    free_at[i_min] += dist_back / speed_m_s
+                    total_distance[i_min] += dist_back
+                    pos_x[i_min] = start_x
+                    pos_y[i_min] = start_y
+                    capacity_used[i_min] = 0
+
+        return free_at.max(), total_distance.sum()
 
 
 def concurrency_simulation(num_agents, speed_m_s, trash_locations, capacity=0, start=(0, 0)):
@@ -7,8 +74,8 @@ def concurrency_simulation(num_agents, speed_m_s, trash_locations, capacity=0, s
     each moving at 'speed_m_s' (m/s). The trash locations are assigned one-by-one
     using a concurrency approach:
 
-    1. Find the agent with the smallest 'time_to_free'.
-    2. Advance the global clock by that amount (subtract it from all agents).
+    1. Find the agent that becomes free first (agents sit in a min-heap keyed on that time).
+    2. Advance the global clock to that time.
     3. That agent picks up the closest trash item. Its travel time is added to its timer,
        its position updated, and its total distance accumulated.
     4. If capacity > 0, increment its capacity usage; when capacity is reached, the agent
@@ -21,60 +88,62 @@ def concurrency_simulation(num_agents, speed_m_s, trash_locations, capacity=0, s
         final_time_seconds: total simulation time (seconds) when the last trash is collected.
         total_distance: total distance traveled by all agents.
     """
-    if num_agents <= 0 or speed_m_s <= 0 or not trash_locations:
+    if num_agents <= 0 or speed_m_s <= 0 or len(trash_locations) == 0:
         return 0.0, 0.0
 
-    agents = []
-    for _ in range(num_agents):
-        agents.append({
-            "position": start,
-            "time_to_free": 0.0,
-            "total_distance": 0.0,
-            "capacity_used": 0
-        })
-
-    remaining_trash = trash_locations.copy()
-    time_passed = 0.0
-
-    while remaining_trash:
-        i_min = min(range(num_agents), key=lambda i: agents[i]["time_to_free"])
-        t_min = agents[i_min]["time_to_free"]
-
-        time_passed += t_min
-        for ag in agents:
-            ag["time_to_free"] -= t_min
-
-        agents[i_min]["time_to_free"] = 0.0
-        current_pos = agents[i_min]["position"]
-
-        closest_idx, closest_dist = None, float('inf')
-        for idx, trash_pos in enumerate(remaining_trash):
-            dist = math.hypot(trash_pos[0] - current_pos[0], trash_pos[1] - current_pos[1])
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_idx = idx
-
-        if closest_idx is None:
-            break
-
-        trash_pos = remaining_trash.pop(closest_idx)
+    trash = np.array(trash_locations, dtype=np.float64).reshape(-1, 2)
+    if HAVE_NUMBA:
+        final_time_seconds, total_distance = _concurrency_core(
+            trash, num_agents, float(speed_m_s), capacity, float(start[0]), float(start[1]))
+        return float(final_time_seconds), float(total_distance)
+
+    # Per-agent state as parallel arrays, laid out like the numba kernel's
+    positions = np.empty((num_agents, 2))
+    positions[:] = start
+    total_distances = np.zeros(num_agents)
+    capacity_used = np.zeros(num_agents, dtype=np.int64)
+
+    # (time the agent becomes free, agent index); all agents start free at time 0
+    free_heap = [(0.0, i) for i in range(num_agents)]
+
+    # Remaining trash as x/y columns whose first `count` entries are still on the ground;
+    # a picked item is overwritten by the last live one
+    trash_x = trash[:, 0].copy()
+    trash_y = trash[:, 1].copy()
+    count = len(trash_x)
+
+    while count:
+        free_at, i_min = heapq.heappop(free_heap)
+        current_pos = positions[i_min]
+
+        # Closest trash by squared distance over the live items in one pass
+        d2 = (trash_x[:count] - current_pos[0]) ** 2 + (trash_y[:count] - current_pos[1]) ** 2
+        closest_idx = int(d2.argmin())
+        closest_dist = math.sqrt(d2[closest_idx])
+
+        trash_pos = (float(trash_x[closest_idx]), float(trash_y[closest_idx]))
+        count -= 1
+        trash_x[closest_idx] = trash_x[count]
+        trash_y[closest_idx] = trash_y[count]
         travel_time = closest_dist / speed_m_s
-        agents[i_min]["time_to_free"] += travel_time
-        agents[i_min]["total_distance"] += closest_dist
-        agents[i_min]["position"] = trash_pos
+        free_at += travel_time
+        total_distances[i_min] += closest_dist
+        positions[i_min] = trash_pos
 
         if capacity > 0:
-            agents[i_min]["capacity_used"] += 1
-            if agents[i_min]["capacity_used"] >= capacity:
+            capacity_used[i_min] += 1
+            if capacity_used[i_min] >= capacity:
                 dist_back = math.hypot(trash_pos[0] - start[0], trash_pos[1] - start[1])
                 travel_time_back = dist_back / speed_m_s
-                agents[i_min]["time_to_free"] += travel_time_back
-                agents[i_min]["total_distance"] += dist_back
-                agents[i_min]["position"] = start
-                agents[i_min]["capacity_used"] = 0
+                free_at += travel_time_back
+                total_distances[i_min] += dist_back
+                positions[i_min] = start
+                capacity_used[i_min] = 0
+
+        heapq.heappush(free_heap, (free_at, i_min))
 
-    final_time_seconds = time_passed + max(ag["time_to_free"] for ag in agents)
-    total_distance = sum(ag["total_distance"] for ag in agents)
+    final_time_seconds = max(free_at for free_at, _ in free_heap)
+    total_distance = float(total_distances.sum())
 
     return final_time_seconds, total_distance
 
@@ -90,23 +159,20 @@ def compute_costs(
     based on the simulation’s final_time (in seconds) for each environment.
 
     Returns:
-        days_list: list of day indices (0..days)
-        drone_costs: cumulative cost for drones on each day
-        human_costs: cumulative cost for humans on each day
+        days_list: array of day indices (0..days)
+        drone_costs: array of the cumulative cost for drones on each day
+        human_costs: array of the cumulative cost for humans on each day
     """
     final_time_hours_drones = final_time_seconds_drones / 3600.0
     final_time_hours_humans = final_time_seconds_humans / 3600.0
 
-    days_list = list(range(days + 1))
+    # One event per day, so both costs grow linearly with the day index
+    per_day_drones = final_time_hours_drones * n_drones * drone_hourly_cost
+    per_day_humans = final_time_hours_humans * n_humans * human_hourly_cost
 
-    drone_costs = [
-        (n_drones * drone_initial_cost) + d * (final_time_hours_drones * n_drones * drone_hourly_cost)
-        for d in days_list
-    ]
-    human_costs = [
-        d * (final_time_hours_humans * n_humans * human_hourly_cost)
-        for d in days_list
-    ]
+    days_list = np.arange(days + 1)
+    drone_costs = (n_drones * drone_initial_cost) + days_list * per_day_drones
+    human_costs = days_list * per_day_humans
 
     return days_list, drone_costs, human_costs
 
@@ -1,4 +1,6 @@
+import heapq
 import math
+import numpy as np
 from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QBrush, QPen, QColor
@@ -20,32 +22,26 @@ def simulate_day_events(num_agents, speed_m_s, trash_locations, capacity, start)
     for i in range(num_agents):
         agents.append({
             'position': start,
-            'time_to_free': 0.0,
-            'capacity_used': 0,
             'schedule': []  # list of segments
         })
-    remaining = list(enumerate(trash_locations))  # list of (trash_index, position)
-    time_passed = 0.0
+    # Min-heap of (absolute time the agent becomes free, agent index); advancing the
+    # clock never touches the other agents
+    free_heap = [(0.0, i) for i in range(num_agents)]
+    capacity_used = np.zeros(num_agents, dtype=np.int64)
+    # Trash as an (n, 2) array; picked-up items are masked instead of removed
+    trash_xy = np.asarray(trash_locations, dtype=np.float64).reshape(-1, 2)
+    picked = np.zeros(len(trash_xy), dtype=bool)
+    remaining = len(trash_xy)
     while remaining:
-        i_min = min(range(num_agents), key=lambda i: agents[i]['time_to_free'])
-        t_min = agents[i_min]['time_to_free']
-        time_passed += t_min
-        for agent in agents:
-            agent['time_to_free'] -= t_min
-        agents[i_min]['time_to_free'] = 0.0
+        time_passed, i_min = heapq.heappop(free_heap)
+        free_at = time_passed
         current_pos = agents[i_min]['position']
-        # Find closest trash item
-        best = None
-        best_dist = float('inf')
-        for item in remaining:
-            idx, pos = item
-            d = math.hypot(pos[0] - current_pos[0], pos[1] - current_pos[1])
-            if d < best_dist:
-                best = item
-                best_dist = d
-        if best is None:
-            break
-        trash_idx, trash_pos = best
+        # Find closest trash item: squared distances to all items in one pass
+        d2 = (trash_xy[:, 0] - current_pos[0]) ** 2 + (trash_xy[:, 1] - current_pos[1]) ** 2
+        d2[picked] = np.inf
+        trash_idx = int(d2.argmin())
+        best_dist = math.sqrt(d2[trash_idx])
+        trash_pos = trash_locations[trash_idx]
         travel_time = best_dist / speed_m_s
         segment = {
             'start_time': time_passed,
@@ -57,11 +53,12 @@ def simulate_day_events(num_agents, speed_m_s, trash_locations, capacity, start)
         }
         agents[i_min]['schedule'].append(segment)
         agents[i_min]['position'] = trash_pos
-        agents[i_min]['time_to_free'] += travel_time
-        remaining = [item for item in remaining if item[0] != trash_idx]
+        free_at += travel_time
+        picked[trash_idx] = True
+        remaining -= 1
         if capacity > 0:
-            agents[i_min]['capacity_used'] += 1
-            if agents[i_min]['capacity_used'] >= capacity:
+            capacity_used[i_min] += 1
+            if capacity_used[i_min] >= capacity:
                 d_back = math.hypot(agents[i_min]['position'][0] - start[0], agents[i_min]['position'][1] - start[1])
                 travel_time_back = d_back / speed_m_s
                 segment_return = {
@@ -74,9 +71,10 @@ def simulate_day_events(num_agents, speed_m_s, trash_locations, capacity, start)
                 }
                 agents[i_min]['schedule'].append(segment_return)
                 agents[i_min]['position'] = start
-                agents[i_min]['time_to_free'] += travel_time_back
-                agents[i_min]['capacity_used'] = 0
-    final_time = time_passed + max(agent['time_to_free'] for agent in agents)
+                free_at += travel_time_back
+                capacity_used[i_min] = 0
+        heapq.heappush(free_heap, (free_at, i_min))
+    final_time = max(free_at for free_at, _ in free_heap)
     return agents, final_time
 
 
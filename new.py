@@ -91,13 +91,14 @@ class RoutingManager:
             return [start]
 
         path = [start]
-        remaining = points.copy()
-        current = start
-        while remaining:
-            nearest = min(remaining, key=lambda p: self.distance(current, p))
-            path.append(nearest)
-            remaining.remove(nearest)
-            current = nearest
+        pts = np.asarray(points, dtype=float)
+        active = np.ones(len(pts), dtype=bool)
+        cx, cy = start
+        for _ in range(len(pts)):
+            j = self.nearest_index(pts, active, cx, cy)
+            active[j] = False
+            path.append(points[j])
+            cx, cy = pts[j]
         return path
 
     def capacity_split_path(self, start, points, capacity):
@@ -113,24 +114,35 @@ class RoutingManager:
             return base_path
 
         # limited capacity
-        remaining = points.copy()
         full_path = [start]
-        current = start
+        pts = np.asarray(points, dtype=float)
+        active = np.ones(len(pts), dtype=bool)
+        remaining = len(pts)
         while remaining:
-            # pick up to capacity pieces
-            chunk = []
-            for _ in range(min(capacity, len(remaining))):
-                nearest = min(remaining, key=lambda p: self.distance(current, p))
-                chunk.append(nearest)
-                remaining.remove(nearest)
-                current = nearest
-
-            full_path.extend(chunk)
+            # pick up to capacity pieces, starting from the bin
+            cx, cy = start
+            for _ in range(min(capacity, remaining)):
+                j = self.nearest_index(pts, active, cx, cy)
+                active[j] = False
+                full_path.append(points[j])
+                cx, cy = pts[j]
+                remaining -= 1
+
             # Return to start (bin)
             full_path.append(start)
-            current = start
         return full_path
 
+    @staticmethod
+    def nearest_index(pts, active, cx, cy):
+        """
+        Index of the active point closest to (cx, cy), using squared distances.
+        """
+        dx = pts[:, 0] - cx
+        dy = pts[:, 1] - cy
+        d2 = dx * dx + dy * dy
+        d2[~active] = np.inf
+        return int(d2.argmin())
+
     # Example TSP approach using OR-Tools (sketch)
     # def or_tools_tsp(self, start, points):
     #     from ortools.constraint_solver import pywrapcp, routing_enums
@@ -170,7 +182,8 @@ class Agent:
         self.env = environment
         self.route = route if route else []
         self.position_index = 0
-        self.current_position = self.route[0] if self.route else environment.bin_position
+        # Position as two floats, updated in place every tick (see current_position)
+        self.cx, self.cy = self.route[0] if self.route else environment.bin_position
 
         # Movement parameters
         self.speed = speed             # current speed
@@ -191,6 +204,14 @@ class Agent:
         # For collecting trash
         self.collected_positions = set()
 
+    @property
+    def current_position(self):
+        return (self.cx, self.cy)
+
+    @current_position.setter
+    def current_position(self, position):
+        self.cx, self.cy = position
+
     def update(self, dt):
         """
         Update the agent's state for this time step.
@@ -213,7 +234,9 @@ class Agent:
             return  # finished route
 
         next_pos = self.route[self.position_index + 1]
-        dist = self.distance(self.current_position, next_pos)
+        dx = next_pos[0] - self.cx
+        dy = next_pos[1] - self.cy
+        dist = math.hypot(dx, dy)
 
         # Increase speed with acceleration (simple model)
         if self.acceleration != 0:
@@ -225,7 +248,7 @@ class Agent:
 
         if step_dist >= dist:
             # We arrive at the next waypoint
-            self.current_position = next_pos
+            self.cx, self.cy = next_pos
             self.distance_traveled += dist
             self.position_index += 1
 
@@ -238,9 +261,8 @@ class Agent:
         else:
             # Move partially toward next_pos
             ratio = step_dist / dist
-            nx = self.current_position[0] + ratio*(next_pos[0] - self.current_position[0])
-            ny = self.current_position[1] + ratio*(next_pos[1] - self.current_position[1])
-            self.current_position = (nx, ny)
+            self.cx += ratio*dx
+            self.cy += ratio*dy
             self.distance_traveled += step_dist
 
     @staticmethod
@@ -329,6 +351,8 @@ class SimulationVisualizer(FigureCanvasQTAgg):
 
         # Some state references
         self.agents = []
+        self.human_agents = []
+        self.drone_agents = []
         self.env = None
 
         # For real-time updates
@@ -342,6 +366,7 @@ class SimulationVisualizer(FigureCanvasQTAgg):
         self.drone_patches = []
         self.trash_scat_human = None
         self.trash_scat_drone = None
+        self.shown_trash = 0  # trash count the scatters currently show
         self.bin_patch_human = None
         self.bin_patch_drone = None
 
@@ -381,6 +406,7 @@ class SimulationVisualizer(FigureCanvasQTAgg):
         hy = [p[1] for p in env.trash_positions]
         self.trash_scat_human = self.ax_human.scatter(hx, hy, c='red')
         self.trash_scat_drone = self.ax_drone.scatter(hx, hy, c='red')
+        self.shown_trash = len(env.trash_positions)
 
         # Info text
         self.human_info_text = self.ax_human.text(
@@ -400,7 +426,13 @@ class SimulationVisualizer(FigureCanvasQTAgg):
         """
         Add references to the agents we want to visualize.
         """
-        self.agents = list(human_agents) + list(drone_agents)
+        self.human_agents = list(human_agents)
+        self.drone_agents = list(drone_agents)
+        self.agents = self.human_agents + self.drone_agents
+
+        # Patches from an earlier run were cleared along with the axes
+        self.human_patches = []
+        self.drone_patches = []
 
         # For each human agent, add a circle patch in ax_human
         for i, agent in enumerate(human_agents):
@@ -432,34 +464,24 @@ class SimulationVisualizer(FigureCanvasQTAgg):
         for agent in self.agents:
             agent.update(dt)
 
-        # Update circle positions
-        for hp in self.human_patches:
-            # Find which agent it belongs to
-            # (Here we rely on the matching index in the agent list)
-            idx = self.human_patches.index(hp)
-            agent = [a for a in self.agents if isinstance(a, HumanAgent)][idx]
+        # Update circle positions (patches were created in agent order)
+        for hp, agent in zip(self.human_patches, self.human_agents):
             hp.center = agent.current_position
 
-        for dp in self.drone_patches:
-            idx = self.drone_patches.index(dp)
-            agent = [a for a in self.agents if isinstance(a, DroneAgent)][idx]
+        for dp, agent in zip(self.drone_patches, self.drone_agents):
             dp.center = agent.current_position
 
         # Update trash scatters if any trash was picked
-        # (Here, we can just re-draw them from the environment)
-        if self.env:
-            hx = [p[0] for p in self.env.trash_positions]
-            hy = [p[1] for p in self.env.trash_positions]
-            self.trash_scat_human.set_offsets(np.c_[hx, hy])
-            self.trash_scat_drone.set_offsets(np.c_[hx, hy])
+        if self.env and len(self.env.trash_positions) != self.shown_trash:
+            offsets = np.asarray(self.env.trash_positions, dtype=float).reshape(-1, 2)
+            self.trash_scat_human.set_offsets(offsets)
+            self.trash_scat_drone.set_offsets(offsets)
+            self.shown_trash = len(offsets)
 
         # Update info text
         # For simplicity, assume one human agent and one drone agent
-        human_agents = [a for a in self.agents if isinstance(a, HumanAgent)]
-        drone_agents = [a for a in self.agents if isinstance(a, DroneAgent)]
-
-        if human_agents:
-            h = human_agents[0]  # just the first human for display
+        if self.human_agents:
+            h = self.human_agents[0]  # just the first human for display
             collected = len(h.collected_positions)
             total_trash = len(h.collected_positions) + len(self.env.trash_positions)
             self.human_info_text.set_text(
@@ -468,8 +490,8 @@ class SimulationVisualizer(FigureCanvasQTAgg):
                 f"Collected: {collected}/{total_trash}"
             )
 
-        if drone_agents:
-            d = drone_agents[0]  # first drone
+        if self.drone_agents:
+            d = self.drone_agents[0]  # first drone
             collected = len(d.collected_positions)
             total_trash = len(d.collected_positions) + len(self.env.trash_positions)
             self.drone_info_text.set_text(
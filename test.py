@@ -20,6 +20,15 @@ def distance(p1, p2):
     """Euclidean distance between two points (x1, y1) and (x2, y2)."""
     return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
 
+def nearest_unvisited(points, visited, pos):
+    """
+    Index of the point in 'points' (an (n, 2) array) closest to 'pos' that is not
+    marked in 'visited'. Ties go to the lowest index, like min() over a list.
+    """
+    d2 = (points[:, 0] - pos[0]) ** 2 + (points[:, 1] - pos[1]) ** 2
+    d2[visited] = np.inf
+    return int(d2.argmin())
+
 def nearest_neighbor_path(start, trash_points):
     """
     A simple nearest neighbor path from 'start' visiting each point
@@ -29,13 +38,15 @@ def nearest_neighbor_path(start, trash_points):
         return [start]
 
     path = [start]
-    remaining = trash_points.copy()
+    # Visited points are masked rather than removed from a list
+    points = np.asarray(trash_points, dtype=float).reshape(-1, 2)
+    visited = np.zeros(len(points), dtype=bool)
     current_pos = start
-    while remaining:
-        nearest = min(remaining, key=lambda p: distance(current_pos, p))
-        path.append(nearest)
-        remaining.remove(nearest)
-        current_pos = nearest
+    for _ in range(len(points)):
+        idx = nearest_unvisited(points, visited, current_pos)
+        visited[idx] = True
+        current_pos = trash_points[idx]
+        path.append(current_pos)
     return path
 
 def build_path_with_capacity(bin_pos, trash_points, capacity):
@@ -68,18 +79,21 @@ def build_path_with_capacity(bin_pos, trash_points, capacity):
     # --------------------------------------------------
     # LIMITED CAPACITY CASE
     # --------------------------------------------------
-    remaining = trash_points.copy()
+    points = np.asarray(trash_points, dtype=float).reshape(-1, 2)
+    visited = np.zeros(len(points), dtype=bool)
+    remaining = len(points)
     full_path = [bin_pos]
     current_pos = bin_pos
 
     while remaining:
         sub_path = []
         # We'll collect up to 'capacity' pieces in a sub-route
-        for _ in range(min(capacity, len(remaining))):
-            nearest = min(remaining, key=lambda p: distance(current_pos, p))
-            sub_path.append(nearest)
-            remaining.remove(nearest)
-            current_pos = nearest
+        for _ in range(min(capacity, remaining)):
+            idx = nearest_unvisited(points, visited, current_pos)
+            visited[idx] = True
+            remaining -= 1
+            current_pos = trash_points[idx]
+            sub_path.append(current_pos)
 
         # Add the sub-path (the chunk) to our final path
         full_path.extend(sub_path)
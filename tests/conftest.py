@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The models are plain scripts in directories with spaces in their names, not packages
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ("Mathimatical model using 03", "Mathimatical model from scratch"):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+# Appended rather than prepended: its ui.py must not shadow UI.py on case-insensitive filesystems
+sys.path.append(os.path.join(ROOT, "new approach"))
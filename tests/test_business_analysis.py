@@ -0,0 +1,29 @@
+import math
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+
+import UI
+
+
+def test_zero_time_frame_step_is_an_input_error():
+    with pytest.raises(ValueError, match="Field time_frame_step: must be a positive finite number"):
+        UI.check_time_frame_range(1.0, 5.0, 0.0)
+
+
+@pytest.mark.parametrize("step", [-1.0, math.inf, math.nan])
+def test_non_positive_or_non_finite_step_is_an_input_error(step):
+    with pytest.raises(ValueError, match="Field time_frame_step"):
+        UI.check_time_frame_range(1.0, 5.0, step)
+
+
+def test_non_finite_bounds_are_input_errors():
+    with pytest.raises(ValueError, match="Field time_frame_stop"):
+        UI.check_time_frame_range(1.0, math.inf, 1.0)
+
+
+def test_valid_range_passes():
+    UI.check_time_frame_range(1.0, 30.0, 1.0)
+    assert list(UI.inclusive_range(1.0, 5.0, 1.0)) == [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pygame")
+pytest.importorskip("numba")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Claude
+
+# float32 state: the two backends may round differently in the last bits
+POSITION_TOLERANCE = 1e-4  # m
+BATTERY_TOLERANCE = 1e-4  # battery percentage points
+
+
+def run_headless(monkeypatch, have_numba, steps=400):
+    monkeypatch.setattr(Claude, "HAVE_NUMBA", have_numba)
+    sim = Claude.Simulation(Claude.Environment(50, 50))
+    rng = np.random.default_rng(3)
+    for k in range(12):
+        agent = (Claude.Human if k % 2 else Claude.Drone)(Claude.Vector2D(*rng.random(2) * 50))
+        agent.path = [Claude.Vector2D(*rng.random(2) * 50) for _ in range(6)]
+        sim.add_agent(agent)
+    sim.start(duration=float("inf"))
+    for _ in range(steps):
+        sim.step()
+    sim.stop()
+    return sim
+
+
+def test_numba_and_numpy_backends_agree(monkeypatch):
+    fast = run_headless(monkeypatch, True)
+    fallback = run_headless(monkeypatch, False)
+
+    np.testing.assert_allclose(fast.pos_xy, fallback.pos_xy, rtol=0, atol=POSITION_TOLERANCE)
+    np.testing.assert_allclose(fast.battery, fallback.battery, rtol=0, atol=BATTERY_TOLERANCE)
+    np.testing.assert_allclose(fast.fatigue, fallback.fatigue, rtol=0, atol=1e-6)
+    assert [a.path_idx for a in fast.agents] == [a.path_idx for a in fallback.agents]
+    # The run is long enough for agents to reach waypoints, not only to set off
+    assert any(a.path_idx > 0 for a in fast.agents)
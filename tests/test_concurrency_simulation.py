@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+import simulation
+
+
+@pytest.mark.parametrize("capacity", [0, 1, 4])
+def test_numba_kernel_matches_numpy_fallback(monkeypatch, capacity):
+    rng = np.random.default_rng(7)
+    for num_agents in (1, 3, 6):
+        trash = rng.random((120, 2)) * (80.0, 50.0)
+        start = (12.5, 3.0)
+        with monkeypatch.context() as m:
+            m.setattr(simulation, "HAVE_NUMBA", True)
+            fast = simulation.concurrency_simulation(num_agents, 1.7, trash.copy(), capacity, start)
+        with monkeypatch.context() as m:
+            m.setattr(simulation, "HAVE_NUMBA", False)
+            fallback = simulation.concurrency_simulation(num_agents, 1.7, trash.copy(), capacity, start)
+
+        assert np.allclose(fast, fallback, rtol=1e-9, atol=0.0)
+
+
+def test_empty_inputs_give_zero_totals():
+    assert simulation.concurrency_simulation(3, 1.0, [], 2) == (0.0, 0.0)
+    assert simulation.concurrency_simulation(0, 1.0, [(1.0, 2.0)], 2) == (0.0, 0.0)
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+
+import UI
+
+
+def make_widget(trash):
+    # get_route only needs the environment, the routing manager and the cache
+    env = UI.SimulationEnvironment()
+    env.set_bin_position((0.0, 0.0))
+    env.trash_positions = trash
+    return SimpleNamespace(env=env, routing_mgr=UI.RoutingManager(), _route_cache={},
+                           ROUTE_CACHE_SIZE=UI.OperationalSimulationWidget.ROUTE_CACHE_SIZE)
+
+
+def get_route(widget, *args):
+    return UI.OperationalSimulationWidget.get_route(widget, *args)
+
+
+def test_cached_route_waypoints_belong_to_the_current_layout():
+    widget = make_widget([(1.0, 2.0), (3.0, 4.0)])
+    get_route(widget, "Nearest Neighbor", widget.env.trash_positions)
+
+    # Equal to the first layout after rounding to 6 decimals, but not exactly
+    widget.env.trash_positions = [(1.0 + 1e-9, 2.0), (3.0, 4.0 - 1e-9)]
+    route = get_route(widget, "Nearest Neighbor", widget.env.trash_positions)
+
+    assert len(widget._route_cache) == 2
+    assert all(widget.env.trash_index(p) >= 0 for p in route[1:-1])
+
+
+def test_repeated_inputs_reuse_the_route():
+    widget = make_widget([(1.0, 2.0), (3.0, 4.0), (5.0, 1.0)])
+    first = get_route(widget, "Capacity-based", widget.env.trash_positions, 2)
+    second = get_route(widget, "Capacity-based", widget.env.trash_positions, 2)
+    assert first == second
+    assert first is not second
+    assert len(widget._route_cache) == 1
+
+
+def test_route_cache_evicts_oldest_entry():
+    widget = make_widget([(1.0, 1.0)])
+    size = widget.ROUTE_CACHE_SIZE
+    for i in range(size + 1):
+        get_route(widget, "Nearest Neighbor", [(float(i), 1.0)])
+
+    assert len(widget._route_cache) == size
+    cached_points = [key[1] for key in widget._route_cache]
+    assert ((0.0, 1.0),) not in cached_points
+    assert ((float(size), 1.0),) in cached_points
@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+
+from environment import Environment
+
+
+def brute_force_closest(trash_items, x, y):
+    return min(trash_items, key=lambda t: math.hypot(t.x - x, t.y - y))
+
+
+def test_closest_trash_matches_brute_force_while_most_trash_is_removed():
+    np.random.seed(11)
+    environment = Environment(width=100, height=60, number_of_trash=300)
+    alive = list(environment.trash_list)
+    rng = np.random.default_rng(11)
+    x, y = 0.0, 0.0
+
+    # Walk like a greedy collector: querying from the item just removed means its
+    # nearest neighbours are often removed too, so the k search has to widen
+    while len(alive) > 10:
+        expected = brute_force_closest(alive, x, y)
+        trash, distance = environment.closest_trash(x, y)
+        assert trash is expected
+        assert math.isclose(distance, math.hypot(trash.x - x, trash.y - y), rel_tol=1e-12)
+        alive.remove(trash)
+        assert environment.remaining_trash() == len(alive)
+        # Every fifth step jump somewhere random instead
+        if len(alive) % 5:
+            x, y = trash.x, trash.y
+        else:
+            x, y = rng.random() * 100, rng.random() * 60
+
+
+def test_trash_returned_to_the_list_is_found_again():
+    np.random.seed(5)
+    environment = Environment(width=50, height=50, number_of_trash=40)
+    alive = list(environment.trash_list)
+
+    for _ in range(15):
+        trash, _ = environment.closest_trash(25.0, 25.0)
+        alive.remove(trash)
+
+    # A full collector leaves the item it walked to (see Simulator.visit)
+    trash, _ = environment.closest_trash(25.0, 25.0)
+    environment.trash_list.append(trash)
+    assert environment.remaining_trash() == len(alive)
+
+    again, _ = environment.closest_trash(25.0, 25.0)
+    assert again is trash
+    alive.remove(trash)
+
+    while alive:
+        expected = brute_force_closest(alive, 10.0, 40.0)
+        got, _ = environment.closest_trash(10.0, 40.0)
+        assert got is expected
+        alive.remove(got)
+    assert environment.remaining_trash() == 0
+    assert environment.closest_trash(0.0, 0.0) == (None, None)
@@ -0,0 +1,76 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from environment import Environment
+from simulator import Simulator
+from trashCollector import TrashCollector
+
+
+def make_environment(seed):
+    np.random.seed(seed)
+    environment = Environment(width=40, height=30, number_of_trash=25, bin_position=(0, 0))
+    for i, trash in enumerate(environment.trash_list):
+        trash.weight = 1.0 + (i % 3)
+    return environment
+
+
+def make_collector(capacity_kg):
+    return TrashCollector(speed=1.5, capacity_items=10, hourly_cost=20.0, capacity_kg=capacity_kg)
+
+
+def test_single_collector_matches_between_calc_time_and_calc_time_multi():
+    # A 4 kg limit binds well before the 10 item limit
+    for seed in range(5):
+        single = make_collector(capacity_kg=4.0)
+        environment = make_environment(seed)
+        Simulator(environment, [], [single]).calc_time(single, environment)
+
+        multi = make_collector(capacity_kg=4.0)
+        environment = make_environment(seed)
+        total = Simulator(environment, [], [multi]).calc_time_multi([multi], environment)
+
+        assert environment.remaining_trash() == 0
+        assert total == multi.total_time
+        assert np.isclose(single.total_time, multi.total_time, rtol=1e-12)
+        assert (single.x, single.y) == (multi.x, multi.y)
+
+
+def test_non_positive_weight_limit_still_collects_everything():
+    for capacity_kg in (0.0, -1.0):
+        collector = make_collector(capacity_kg=capacity_kg)
+        environment = make_environment(0)
+        Simulator(environment, [], [collector]).calc_time(collector, environment)
+        assert environment.remaining_trash() == 0
+        assert collector.total_time > 0
+
+
+def reference_makespan(collectors, environment):
+    # Event order written out by hand: the collector that is free first (lowest index on
+    # a tie) walks to its nearest remaining trash, found by brute force
+    remaining = SimpleNamespace(trash_list=list(environment.trash_list),
+                                bin_position=environment.bin_position)
+    while remaining.trash_list:
+        collector = min(collectors, key=lambda c: c.total_time)
+        distances = [math.hypot(t.x - collector.x, t.y - collector.y) for t in remaining.trash_list]
+        j = int(np.argmin(distances))
+        Simulator.visit(collector, remaining.trash_list.pop(j), distances[j], remaining)
+    return max(c.total_time for c in collectors)
+
+
+def test_calc_time_multi_dispatches_the_earliest_free_collector():
+    speeds = (0.6, 1.5, 3.2)
+    for seed in range(5):
+        reference = [TrashCollector(speed=s, capacity_items=4, hourly_cost=20.0, capacity_kg=6.0) for s in speeds]
+        expected = reference_makespan(reference, make_environment(seed))
+
+        collectors = [TrashCollector(speed=s, capacity_items=4, hourly_cost=20.0, capacity_kg=6.0) for s in speeds]
+        environment = make_environment(seed)
+        makespan = Simulator(environment, [], collectors).calc_time_multi(collectors, environment)
+
+        assert environment.remaining_trash() == 0
+        assert np.isclose(makespan, expected, rtol=1e-12)
+        for collector, ref in zip(collectors, reference):
+            assert np.isclose(collector.total_time, ref.total_time, rtol=1e-12)
+            assert (collector.x, collector.y) == (ref.x, ref.y)